@@ -4,6 +4,7 @@ import hashlib
 from pathlib import Path
 
 from fasthtml.common import *
+from starlette.middleware.gzip import GZipMiddleware
 
 from .data.instruments import set_instrument_definition_repo
 from .middleware import make_auth_beforeware
@@ -54,6 +55,10 @@ app, rt = fast_app(
     static_path=str(static_dir),
 )
 
+# Compress HTML/JSON responses (large sample tables, validation pages).
+# GZipMiddleware adds "Vary: Accept-Encoding" to compressed responses.
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Initialize services
 set_instrument_definition_repo(get_instrument_definition_repo())  # Enable synced instruments
 auth_service = init_auth_service()
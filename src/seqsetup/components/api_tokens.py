@@ -2,10 +2,16 @@
 
 from typing import Optional
 
-from fasthtml.common import *
+from fasthtml.common import (
+    Button, Code, Div, Fieldset, Form, H2, H3, Input, Label, Legend, P, Table,
+    Tbody, Td, Th, Thead, Tr,
+)
 
 from ..models.api_token import ApiToken
 
+_REVOKE_CONFIRM = "Revoke token '{}'? This cannot be undone.".format
+_REVOKE_URL = "/admin/api-tokens/{}/revoke".format
+
 
 def ApiTokensPage(
     tokens: list[ApiToken],
@@ -104,26 +110,6 @@ def TokenTable(tokens: list[ApiToken]):
             style="margin-top: 1rem;",
         )
 
-    rows = []
-    for token in tokens:
-        rows.append(
-            Tr(
-                Td(token.name),
-                Td(token.created_by),
-                Td(token.created_at.strftime("%Y-%m-%d %H:%M")),
-                Td(
-                    Button(
-                        "Revoke",
-                        hx_post=f"/admin/api-tokens/{token.id}/revoke",
-                        hx_target="#api-tokens-page",
-                        hx_swap="outerHTML",
-                        hx_confirm=f"Revoke token '{token.name}'? This cannot be undone.",
-                        cls="btn-danger btn-small",
-                    ),
-                ),
-            )
-        )
-
     return Div(
         H3(f"Active Tokens ({len(tokens)})"),
         Table(
@@ -135,8 +121,27 @@ def TokenTable(tokens: list[ApiToken]):
                     Th("Actions"),
                 ),
             ),
-            Tbody(*rows),
+            Tbody(_token_row(token) for token in tokens),
             cls="sample-table",
         ),
         style="margin-top: 1.5rem;",
     )
+
+
+def _token_row(token: ApiToken):
+    """Table row for a single API token."""
+    return Tr(
+        Td(token.name),
+        Td(token.created_by),
+        Td(token.created_at.strftime("%Y-%m-%d %H:%M")),
+        Td(
+            Button(
+                "Revoke",
+                hx_post=_REVOKE_URL(token.id),
+                hx_target="#api-tokens-page",
+                hx_swap="outerHTML",
+                hx_confirm=_REVOKE_CONFIRM(token.name),
+                cls="btn-danger btn-small",
+            ),
+        ),
+    )
@@ -3,8 +3,6 @@
 from fasthtml.common import *
 
 from ..models.sequencing_run import RunStatus
-from ..services.samplesheet_v1_exporter import SampleSheetV1Exporter
-from ..services.validation import ValidationService
 
 
 def RunStatusBar(run):
@@ -187,8 +185,11 @@ def TopBarForRun(run):
 
 def ValidatePanelForRun(run):
     """Validation panel showing run validation status with link to details."""
-    # Run full validation
-    result = ValidationService.validate_run(run)
+    from ..services.validation import SECTION_COLOR_BALANCE, ValidationService
+
+    # Validate for counts only; distance matrices and dark cycle tables are
+    # only needed on the validation page
+    result = ValidationService.validate_run(run, sections={SECTION_COLOR_BALANCE})
 
     # Count issues
     error_count = result.error_count
@@ -276,6 +277,8 @@ def ValidatePanelForRun(run):
 
 def ExportPanelForRun(run):
     """Export panel with download buttons."""
+    from ..services.samplesheet_v1_exporter import SampleSheetV1Exporter
+
     is_ready = run.status == RunStatus.READY
     all_have_indexes = run.all_samples_have_indexes if run.has_samples else False
     ss_enabled = is_ready and all_have_indexes
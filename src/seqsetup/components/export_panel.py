@@ -2,11 +2,24 @@
 
 from typing import Optional
 
-from fasthtml.common import *
+from fasthtml.common import A, Div, NotStr, P
 
 from ..models.sequencing_run import SequencingRun
 from ..models.validation import ValidationResult
-from ..services.validation import ValidationService
+from ..utils.html import escape_html_attr
+
+# Summary for a freshly created run with nothing configured yet (the common
+# blank-form case). Built once at import; must match the output of the
+# general path below for the same run state.
+_EMPTY_RUN_SUMMARY = Div(
+    NotStr(
+        '<p class="status-warning">Warning: No samples added yet</p>'
+        '<p class="status-warning">Warning: Run name not set</p>'
+        '<p class="status-warning">Warning: Flowcell not selected</p>'
+        '<p class="status-warning">Warning: Cycles not configured</p>'
+    ),
+    cls="validation-summary",
+)
 
 
 def ValidationSummary(run: SequencingRun, validation_result: Optional[ValidationResult] = None):
@@ -18,6 +31,9 @@ def ValidationSummary(run: SequencingRun, validation_result: Optional[Validation
         validation_result: Pre-computed validation result. If None, runs basic validation
                           as fallback (no profile checks).
     """
+    if not (run.has_samples or run.run_name or run.flowcell_type or run.run_cycles):
+        return _EMPTY_RUN_SUMMARY
+
     warnings = []
     errors = []
 
@@ -41,7 +57,10 @@ def ValidationSummary(run: SequencingRun, validation_result: Optional[Validation
     if run.has_samples:
         # Use pre-computed result or fall back to basic validation
         if validation_result is None:
-            validation_result = ValidationService.validate_run(run)
+            from ..services.validation import ValidationService
+
+            # Only error lists are shown here; skip heatmap/color balance data
+            validation_result = ValidationService.validate_run(run, sections=())
 
         # Add duplicate sample ID errors
         for dup_error in validation_result.duplicate_sample_ids:
@@ -66,9 +85,15 @@ def ValidationSummary(run: SequencingRun, validation_result: Optional[Validation
             cls="validation-summary ok",
         )
 
+    # Pre-join messages into one block; a run with many duplicate IDs can
+    # produce hundreds of errors. Messages may contain sample IDs, so escape.
+    messages_html = "".join(
+        [f'<p class="status-error">Error: {escape_html_attr(e)}</p>' for e in errors]
+        + [f'<p class="status-warning">Warning: {escape_html_attr(w)}</p>' for w in warnings]
+    )
+
     return Div(
-        *[P(f"Error: {e}", cls="status-error") for e in errors],
-        *[P(f"Warning: {w}", cls="status-warning") for w in warnings],
+        NotStr(messages_html),
         validation_link,
         cls="validation-summary" + (" has-errors" if errors else ""),
     )
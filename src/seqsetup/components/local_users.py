@@ -2,11 +2,16 @@
 
 from typing import Optional
 
-from fasthtml.common import *
+from fasthtml.common import (
+    Button, Div, Fieldset, Form, H2, H3, Input, Label, Legend, Option, P, Select,
+    Table, Tbody, Td, Th, Thead, Tr,
+)
 
 from ..models.local_user import LocalUser
 from ..models.user import UserRole
 
+_DELETE_CONFIRM = "Delete user '{}'? This cannot be undone.".format
+
 
 def LocalUsersPage(
     users: list[LocalUser],
@@ -116,40 +121,6 @@ def UserTable(users: list[LocalUser]):
             style="margin-top: 1rem;",
         )
 
-    rows = []
-    for user in users:
-        role_label = "Admin" if user.role == UserRole.ADMIN else "Standard"
-        rows.append(
-            Tr(
-                Td(user.username),
-                Td(user.display_name),
-                Td(user.email or "-"),
-                Td(role_label),
-                Td(user.created_at.strftime("%Y-%m-%d %H:%M") if user.created_at else "-"),
-                Td(
-                    Div(
-                        Button(
-                            "Edit",
-                            hx_get=f"/admin/users/{user.username}/edit-form",
-                            hx_target=f"#user-row-{user.username}",
-                            hx_swap="outerHTML",
-                            cls="btn-secondary btn-small",
-                        ),
-                        Button(
-                            "Delete",
-                            hx_post=f"/admin/users/{user.username}/delete",
-                            hx_target="#local-users-page",
-                            hx_swap="outerHTML",
-                            hx_confirm=f"Delete user '{user.username}'? This cannot be undone.",
-                            cls="btn-danger btn-small",
-                        ),
-                        cls="actions",
-                    ),
-                ),
-                id=f"user-row-{user.username}",
-            )
-        )
-
     return Div(
         H3(f"Users ({len(users)})"),
         Table(
@@ -163,13 +134,46 @@ def UserTable(users: list[LocalUser]):
                     Th("Actions"),
                 ),
             ),
-            Tbody(*rows),
+            Tbody(_user_row(user) for user in users),
             cls="sample-table",
         ),
         style="margin-top: 1.5rem;",
     )
 
 
+def _user_row(user: LocalUser):
+    """Table row for a single local user."""
+    role_label = "Admin" if user.role == UserRole.ADMIN else "Standard"
+    return Tr(
+        Td(user.username),
+        Td(user.display_name),
+        Td(user.email or "-"),
+        Td(role_label),
+        Td(user.created_at.strftime("%Y-%m-%d %H:%M") if user.created_at else "-"),
+        Td(
+            Div(
+                Button(
+                    "Edit",
+                    hx_get=f"/admin/users/{user.username}/edit-form",
+                    hx_target=f"#user-row-{user.username}",
+                    hx_swap="outerHTML",
+                    cls="btn-secondary btn-small",
+                ),
+                Button(
+                    "Delete",
+                    hx_post=f"/admin/users/{user.username}/delete",
+                    hx_target="#local-users-page",
+                    hx_swap="outerHTML",
+                    hx_confirm=_DELETE_CONFIRM(user.username),
+                    cls="btn-danger btn-small",
+                ),
+                cls="actions",
+            ),
+        ),
+        id=f"user-row-{user.username}",
+    )
+
+
 def EditUserRow(user: LocalUser):
     """Inline edit form replacing a user table row."""
     return Tr(
@@ -1,6 +1,6 @@
 """Run configuration UI component (read-only display for overview)."""
 
-from fasthtml.common import *
+from fasthtml.common import Div, Fieldset, H3, Legend, NotStr, Span
 
 from ..data.instruments import get_flowcells_for_instrument
 from ..models.sequencing_run import RunCycles, SequencingRun
@@ -25,49 +25,73 @@ def RunConfigPanel(run: SequencingRun):
     )
 
 
+# Fallback shown when a run has no cycle configuration yet. Only read here;
+# never assign it to a run.
+_DEFAULT_CYCLES = RunCycles(150, 150, 10, 10)
+
+_METADATA_TEMPLATE = (
+    '<div class="run-metadata">'
+    '<div class="metadata-item">'
+    '<span class="metadata-label">UUID: </span>'
+    '<span class="metadata-value uuid-value" title="{id}">{id}</span>'
+    '</div>'
+    '<div class="metadata-item">'
+    '<span class="metadata-label">Created by: </span>'
+    '<span class="metadata-value">{created_by}</span>'
+    '</div>'
+    '<div class="metadata-item">'
+    '<span class="metadata-label">Created: </span>'
+    '<span class="metadata-value">{created_at}</span>'
+    '<span class="metadata-label"> | Updated: </span>'
+    '<span class="metadata-value">{updated_at}</span>'
+    '</div>'
+    '</div>'
+)
+
+_RUN_NAME_TEMPLATE = (
+    '<div class="run-name-display">'
+    '<div class="config-item">'
+    '<span class="config-label">Run Name: </span>'
+    '<span class="config-value">{run_name}</span>'
+    '</div>'
+    '{description}'
+    '</div>'
+)
+
+_DESCRIPTION_TEMPLATE = (
+    '<div class="config-item">'
+    '<span class="config-label">Description: </span>'
+    '<span class="config-value">{description}</span>'
+    '</div>'
+)
+
+
 def RunMetadataDisplay(run: SequencingRun):
     """Display read-only run metadata (UUID, user, dates)."""
     created_at_str = run.created_at.strftime("%Y-%m-%d %H:%M") if run.created_at else "—"
     updated_at_str = run.updated_at.strftime("%Y-%m-%d %H:%M") if run.updated_at else "—"
     created_by_str = run.created_by or "—"
 
-    return Div(
-        Div(
-            Span("UUID: ", cls="metadata-label"),
-            Span(run.id, cls="metadata-value uuid-value", title=escape_html_attr(run.id)),
-            cls="metadata-item",
-        ),
-        Div(
-            Span("Created by: ", cls="metadata-label"),
-            Span(created_by_str, cls="metadata-value"),
-            cls="metadata-item",
-        ),
-        Div(
-            Span("Created: ", cls="metadata-label"),
-            Span(created_at_str, cls="metadata-value"),
-            Span(" | Updated: ", cls="metadata-label"),
-            Span(updated_at_str, cls="metadata-value"),
-            cls="metadata-item",
-        ),
-        cls="run-metadata",
-    )
+    return NotStr(_METADATA_TEMPLATE.format(
+        id=escape_html_attr(run.id),
+        created_by=escape_html_attr(created_by_str),
+        created_at=created_at_str,
+        updated_at=updated_at_str,
+    ))
 
 
 def RunNameDisplay(run: SequencingRun):
     """Read-only display of run name and description."""
-    return Div(
-        Div(
-            Span("Run Name: ", cls="config-label"),
-            Span(run.run_name or "—", cls="config-value"),
-            cls="config-item",
-        ),
-        Div(
-            Span("Description: ", cls="config-label"),
-            Span(run.run_description or "—", cls="config-value"),
-            cls="config-item",
-        ) if run.run_description else None,
-        cls="run-name-display",
-    )
+    description = ""
+    if run.run_description:
+        description = _DESCRIPTION_TEMPLATE.format(
+            description=escape_html_attr(run.run_description),
+        )
+
+    return NotStr(_RUN_NAME_TEMPLATE.format(
+        run_name=escape_html_attr(run.run_name) or "—",
+        description=description,
+    ))
 
 
 def InstrumentConfigDisplay(run: SequencingRun):
@@ -101,35 +125,38 @@ def InstrumentConfigDisplay(run: SequencingRun):
     )
 
 
+_CYCLE_CONFIG_TEMPLATE = (
+    '<fieldset class="config-panel cycle-config-display" id="cycle-config">'
+    '<legend>Run Cycle Configuration</legend>'
+    '<div class="cycle-display">'
+    '<div class="cycle-item">'
+    '<span class="cycle-label">Read 1: </span>'
+    '<span class="cycle-value">{read1}</span>'
+    '</div>'
+    '<div class="cycle-item">'
+    '<span class="cycle-label">Read 2: </span>'
+    '<span class="cycle-value">{read2}</span>'
+    '</div>'
+    '<div class="cycle-item">'
+    '<span class="cycle-label">Index 1: </span>'
+    '<span class="cycle-value">{index1}</span>'
+    '</div>'
+    '<div class="cycle-item">'
+    '<span class="cycle-label">Index 2: </span>'
+    '<span class="cycle-value">{index2}</span>'
+    '</div>'
+    '</div>'
+    '</fieldset>'
+)
+
+
 def CycleConfigDisplay(run: SequencingRun):
     """Read-only display of cycle configuration."""
-    cycles = run.run_cycles or RunCycles(150, 150, 10, 10)
-
-    return Fieldset(
-        Legend("Run Cycle Configuration"),
-        Div(
-            Div(
-                Span("Read 1: ", cls="cycle-label"),
-                Span(str(cycles.read1_cycles), cls="cycle-value"),
-                cls="cycle-item",
-            ),
-            Div(
-                Span("Read 2: ", cls="cycle-label"),
-                Span(str(cycles.read2_cycles), cls="cycle-value"),
-                cls="cycle-item",
-            ),
-            Div(
-                Span("Index 1: ", cls="cycle-label"),
-                Span(str(cycles.index1_cycles), cls="cycle-value"),
-                cls="cycle-item",
-            ),
-            Div(
-                Span("Index 2: ", cls="cycle-label"),
-                Span(str(cycles.index2_cycles), cls="cycle-value"),
-                cls="cycle-item",
-            ),
-            cls="cycle-display",
-        ),
-        cls="config-panel cycle-config-display",
-        id="cycle-config",
-    )
+    cycles = run.run_cycles or _DEFAULT_CYCLES
+
+    return NotStr(_CYCLE_CONFIG_TEMPLATE.format(
+        read1=int(cycles.read1_cycles),
+        read2=int(cycles.read2_cycles),
+        index1=int(cycles.index1_cycles),
+        index2=int(cycles.index2_cycles),
+    ))
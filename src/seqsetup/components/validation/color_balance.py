@@ -1,5 +1,7 @@
 """Color balance and dark cycles analysis components."""
 
+import io
+from functools import lru_cache
 from typing import Optional
 
 from fasthtml.common import *
@@ -11,6 +13,7 @@ from ...models.validation import (
     SampleDarkCycleInfo,
     ValidationResult,
 )
+from ...utils.html import escape_html_attr
 
 
 def ColorBalanceTabContent(run_id: str, result: ValidationResult):
@@ -44,10 +47,10 @@ def ColorBalanceTabContent(run_id: str, result: ValidationResult):
             cls="colorbalance-tab-content",
         )
 
-    lane_sections = []
-    for lane in sorted(result.color_balance.keys()):
-        lane_balance = result.color_balance[lane]
-        lane_sections.append(LaneColorBalanceSection(lane_balance))
+    lane_sections = [
+        LaneColorBalanceSection(lane_balance)
+        for _, lane_balance in sorted(result.color_balance.items())
+    ]
 
     # Build description from channel config
     cc = result.channel_config
@@ -112,73 +115,78 @@ def IndexColorBalanceTable(index_balance: IndexColorBalance):
 
     # Get channel names from the first position (all positions share same config)
     first_pos = index_balance.positions[0]
-    ch1_name = first_pos.channel1_name
-    ch2_name = first_pos.channel2_name
-
-    # Header row
-    header_cells = [
-        Th("Pos", cls="cb-header"),
-        Th("A", cls="cb-header base-a"),
-        Th("C", cls="cb-header base-c"),
-        Th("G", cls="cb-header base-g"),
-        Th("T", cls="cb-header base-t"),
-        Th(f"{ch1_name} %", cls="cb-header channel-1"),
-        Th(f"{ch2_name} %", cls="cb-header channel-2"),
-        Th("Status", cls="cb-header"),
-    ]
-
-    rows = [Tr(*header_cells, cls="cb-header-row")]
+    ch1_name = escape_html_attr(first_pos.channel1_name)
+    ch2_name = escape_html_attr(first_pos.channel2_name)
+
+    # The table is written as one HTML string rather than one Td component
+    # per cell; every value except the channel names is numeric or fixed.
+    buf = io.StringIO()
+    buf.write(
+        '<table class="colorbalance-table"><tr class="cb-header-row">'
+        '<th class="cb-header">Pos</th>'
+        '<th class="cb-header base-a">A</th>'
+        '<th class="cb-header base-c">C</th>'
+        '<th class="cb-header base-g">G</th>'
+        '<th class="cb-header base-t">T</th>'
+        f'<th class="cb-header channel-1">{ch1_name} %</th>'
+        f'<th class="cb-header channel-2">{ch2_name} %</th>'
+        '<th class="cb-header">Status</th></tr>'
+    )
 
     # Data rows for each position
     for pos in index_balance.positions:
-        status_cls = f"status-{pos.status.value}"
-        status_icon = "\u2713" if pos.status == ColorBalanceStatus.OK else (
-            "\u26a0" if pos.status == ColorBalanceStatus.WARNING else "\u2717"
+        status = pos.status
+        status_cls = f"status-{status.value}"
+        status_icon = "\u2713" if status == ColorBalanceStatus.OK else (
+            "\u26a0" if status == ColorBalanceStatus.WARNING else "\u2717"
         )
-
-        row_cells = [
-            Td(str(pos.position), cls="cb-cell position"),
-            Td(str(pos.a_count), cls="cb-cell base-a"),
-            Td(str(pos.c_count), cls="cb-cell base-c"),
-            Td(str(pos.g_count), cls="cb-cell base-g"),
-            Td(str(pos.t_count), cls="cb-cell base-t"),
-            Td(f"{pos.channel1_percent:.0f}%", cls=f"cb-cell channel-1 {_channel_class(pos.channel1_percent)}"),
-            Td(f"{pos.channel2_percent:.0f}%", cls=f"cb-cell channel-2 {_channel_class(pos.channel2_percent)}"),
-            Td(status_icon, cls=f"cb-cell status {status_cls}"),
-        ]
-        rows.append(Tr(*row_cells, cls=f"cb-row {status_cls}"))
+        ch1_percent = pos.channel1_percent
+        ch2_percent = pos.channel2_percent
+
+        buf.write(
+            f'<tr class="cb-row {status_cls}">'
+            f'<td class="cb-cell position">{pos.position}</td>'
+            f'<td class="cb-cell base-a">{pos.a_count}</td>'
+            f'<td class="cb-cell base-c">{pos.c_count}</td>'
+            f'<td class="cb-cell base-g">{pos.g_count}</td>'
+            f'<td class="cb-cell base-t">{pos.t_count}</td>'
+            f'<td class="cb-cell channel-1 {_channel_class(ch1_percent)}">{ch1_percent:.0f}%</td>'
+            f'<td class="cb-cell channel-2 {_channel_class(ch2_percent)}">{ch2_percent:.0f}%</td>'
+            f'<td class="cb-cell status {status_cls}">{status_icon}</td></tr>'
+        )
+    buf.write("</table>")
 
     return Div(
         H5(f"{index_balance.index_type.upper()} Index", cls="index-type-header"),
-        Table(*rows, cls="colorbalance-table"),
+        NotStr(buf.getvalue()),
         cls="index-colorbalance",
     )
 
 
+# Channel percentage CSS classes: 0, (0, 25), [25, 50), >= 50
+_CHANNEL_CLASSES = ("channel-zero", "channel-low", "channel-medium", "channel-high")
+
+
 def _channel_class(percent: float) -> str:
     """Get CSS class for a channel percentage."""
-    if percent >= 50:
-        return "channel-high"
-    elif percent >= 25:
-        return "channel-medium"
-    elif percent > 0:
-        return "channel-low"
-    return "channel-zero"
+    return _CHANNEL_CLASSES[(percent > 0) + (percent >= 25) + (percent >= 50)]
 
 
 def ColorBalanceLegend(channel_config: Optional[dict] = None):
     """Legend explaining the color balance display."""
     if channel_config:
-        ch1_name = channel_config["channel1_name"]
-        ch1_bases = "+".join(channel_config["channel1_bases"])
-        ch2_name = channel_config["channel2_name"]
-        ch2_bases = "+".join(channel_config["channel2_bases"])
-    else:
-        ch1_name = "Channel 1"
-        ch1_bases = "A+C"
-        ch2_name = "Channel 2"
-        ch2_bases = "C+T"
+        return _color_balance_legend(
+            channel_config["channel1_name"],
+            "+".join(channel_config["channel1_bases"]),
+            channel_config["channel2_name"],
+            "+".join(channel_config["channel2_bases"]),
+        )
+    return _color_balance_legend("Channel 1", "A+C", "Channel 2", "C+T")
 
+
+@lru_cache(maxsize=16)
+def _color_balance_legend(ch1_name: str, ch1_bases: str, ch2_name: str, ch2_bases: str):
+    """Cached ColorBalanceLegend markup per channel configuration (never mutated)."""
     return Div(
         Div(
             Span("Channels: ", cls="legend-label"),
@@ -248,10 +256,8 @@ def DarkCyclesTabContent(run_id: str, result: ValidationResult):
             f"prevent reliable detection of the index read start."
         )
 
-    # Count issues
-    error_count = sum(1 for s in samples if s.i7_leading_dark >= 2 or s.i5_leading_dark >= 2)
-    warning_count = sum(1 for s in samples if (s.i7_leading_dark == 1 or s.i5_leading_dark == 1)
-                        and s.i7_leading_dark < 2 and s.i5_leading_dark < 2)
+    # Render the table and count issues in the same pass over the samples
+    table_html, error_count, warning_count = _render_dark_cycles_table(samples)
 
     status_summary = []
     if error_count > 0:
@@ -268,21 +274,37 @@ def DarkCyclesTabContent(run_id: str, result: ValidationResult):
             DarkCyclesLegend(dark_base),
             cls="darkcycles-header",
         ),
-        DarkCyclesTable(samples),
+        NotStr(table_html),
         cls="darkcycles-tab-content",
     )
 
 
 def DarkCyclesTable(samples: list[SampleDarkCycleInfo]):
     """Table showing dark cycle analysis for all samples."""
-    header_cells = [
-        Th("Sample", cls="dc-header"),
-        Th("i7 Index", cls="dc-header"),
-        Th("i7 Status", cls="dc-header"),
-        Th("i5 Index", cls="dc-header"),
-        Th("i5 Status", cls="dc-header"),
-    ]
-    rows = [Tr(*header_cells, cls="dc-header-row")]
+    return NotStr(_render_dark_cycles_table(samples)[0])
+
+
+def _render_dark_cycles_table(samples: list[SampleDarkCycleInfo]) -> tuple[str, int, int]:
+    """
+    Render the dark cycles table HTML, counting issues along the way.
+
+    Returns:
+        (table_html, error_count, warning_count); a sample counts as an error
+        if either index starts with two dark bases, else as a warning if
+        either starts with one.
+    """
+    # Written as one HTML string rather than nested Td/Span components per
+    # base; sample names and sequences are escaped.
+    error_count = warning_count = 0
+    buf = io.StringIO()
+    buf.write(
+        '<table class="darkcycles-table"><tr class="dc-header-row">'
+        '<th class="dc-header">Sample</th>'
+        '<th class="dc-header">i7 Index</th>'
+        '<th class="dc-header">i7 Status</th>'
+        '<th class="dc-header">i5 Index</th>'
+        '<th class="dc-header">i5 Status</th></tr>'
+    )
 
     for sample in samples:
         # Determine row-level status
@@ -292,73 +314,80 @@ def DarkCyclesTable(samples: list[SampleDarkCycleInfo]):
         row_cls = "dc-row"
         if has_error:
             row_cls += " dc-row-error"
+            error_count += 1
         elif has_warning:
             row_cls += " dc-row-warning"
+            warning_count += 1
 
         # i7 sequence visualization
         if sample.i7_sequence:
             i7_viz = _dark_cycle_sequence_viz(sample.i7_sequence, sample.dark_base)
-            i7_status = _dark_cycle_status(sample.i7_leading_dark)
+            i7_status = _DARK_CYCLE_STATUS[min(sample.i7_leading_dark, 2)]
         else:
-            i7_viz = Span("\u2014", cls="no-index")
-            i7_status = Span("\u2014", cls="no-index")
+            i7_viz = i7_status = _NO_INDEX
 
         # i5 sequence visualization (show read orientation)
         if sample.i5_sequence:
             i5_viz = _dark_cycle_sequence_viz(sample.i5_read_sequence, sample.dark_base)
-            i5_status = _dark_cycle_status(sample.i5_leading_dark)
+            i5_status = _DARK_CYCLE_STATUS[min(sample.i5_leading_dark, 2)]
         else:
-            i5_viz = Span("\u2014", cls="no-index")
-            i5_status = Span("\u2014", cls="no-index")
+            i5_viz = i5_status = _NO_INDEX
+
+        buf.write(
+            f'<tr class="{row_cls}">'
+            f'<td class="dc-cell dc-sample">{escape_html_attr(sample.sample_name)}</td>'
+            f'<td class="dc-cell dc-sequence">{i7_viz}</td>'
+            f'<td class="dc-cell dc-status">{i7_status}</td>'
+            f'<td class="dc-cell dc-sequence">{i5_viz}</td>'
+            f'<td class="dc-cell dc-status">{i5_status}</td></tr>'
+        )
+    buf.write("</table>")
+
+    return buf.getvalue(), error_count, warning_count
+
+
+_NO_INDEX = '<span class="no-index">\u2014</span>'
 
-        rows.append(Tr(
-            Td(sample.sample_name, cls="dc-cell dc-sample"),
-            Td(i7_viz, cls="dc-cell dc-sequence"),
-            Td(i7_status, cls="dc-cell dc-status"),
-            Td(i5_viz, cls="dc-cell dc-sequence"),
-            Td(i5_status, cls="dc-cell dc-status"),
-            cls=row_cls,
-        ))
+# Base CSS classes indexed by (is_dark << 1) | is_leading
+_BASE_CLASSES = (
+    "dc-base",
+    "dc-base dc-leading",
+    "dc-base dc-dark",
+    "dc-base dc-dark dc-leading dc-dark-leading",
+)
 
-    return Table(*rows, cls="darkcycles-table")
+# Status indicator HTML indexed by number of leading dark bases (capped at 2)
+_DARK_CYCLE_STATUS = (
+    '<span class="dc-status-ok">OK</span>',
+    '<span class="dc-status-warning">OK \u2014 one dark</span>',
+    '<span class="dc-status-error">Error \u2014 two dark</span>',
+)
 
 
-def _dark_cycle_sequence_viz(sequence: str, dark_base: str):
+@lru_cache(maxsize=4096)
+def _dark_cycle_sequence_viz(sequence: str, dark_base: str) -> str:
     """
-    Render a sequence with each base color-coded.
+    Render a sequence with each base color-coded, as HTML.
     Dark bases are highlighted. The first two positions are marked specially.
+
+    Cached: index sequences come from shared kits and repeat across samples
+    and runs.
     """
     if not sequence:
-        return Span("\u2014")
-
-    bases = []
-    for i, base in enumerate(sequence):
-        is_dark = base.upper() == dark_base.upper()
-        is_leading = i < 2
-        cls_parts = ["dc-base"]
-        if is_dark:
-            cls_parts.append("dc-dark")
-        if is_leading:
-            cls_parts.append("dc-leading")
-        if is_dark and is_leading:
-            cls_parts.append("dc-dark-leading")
-
-        bases.append(Span(base.upper(), cls=" ".join(cls_parts)))
-
-    return Span(*bases, cls="dc-sequence-viz")
+        return "<span>\u2014</span>"
 
+    dark_base = dark_base.upper()
+    bases = [
+        f'<span class="{_BASE_CLASSES[(base == dark_base) << 1 | (i < 2)]}">{escape_html_attr(base)}</span>'
+        for i, base in enumerate(sequence.upper())
+    ]
 
-def _dark_cycle_status(leading_dark: int):
-    """Return a status indicator for the number of leading dark bases."""
-    if leading_dark >= 2:
-        return Span("Error \u2014 two dark", cls="dc-status-error")
-    elif leading_dark == 1:
-        return Span("OK \u2014 one dark", cls="dc-status-warning")
-    return Span("OK", cls="dc-status-ok")
+    return f'<span class="dc-sequence-viz">{"".join(bases)}</span>'
 
 
+@lru_cache(maxsize=16)
 def DarkCyclesLegend(dark_base: str):
-    """Legend for the dark cycles visualization."""
+    """Legend for the dark cycles visualization (cached per dark base; do not mutate)."""
     return Div(
         Div(
             Span("Base colors: ", cls="legend-label"),
@@ -1,9 +1,15 @@
 """Index distance heatmap visualizations."""
 
+import heapq
+from functools import lru_cache
+
 from fasthtml.common import *
 
 from ...models.validation import IndexDistanceMatrix, ValidationResult
 
+# Lanes with more samples than this show only the highest-risk samples
+MAX_HEATMAP_SAMPLES = 200
+
 
 def HeatmapsTabContent(run_id: str, result: ValidationResult, index_type: str = "i7"):
     """
@@ -20,14 +26,12 @@ def HeatmapsTabContent(run_id: str, result: ValidationResult, index_type: str =
             cls="heatmaps-tab-content",
         )
 
-    # Build heatmap sections for each lane (without individual controls)
-    heatmap_sections = []
-    for lane in sorted(result.distance_matrices.keys()):
-        matrix = result.distance_matrices[lane]
-        if len(matrix.sample_names) >= 2:
-            heatmap_sections.append(
-                LaneHeatmapSimple(lane, matrix, index_type)
-            )
+    # Build heatmap sections for each lane (without individual controls).
+    # Matrices only exist for lanes with two or more indexed samples.
+    heatmap_sections = [
+        LaneHeatmapSimple(lane, matrix, index_type)
+        for lane, matrix in sorted(result.distance_matrices.items())
+    ]
 
     return Div(
         # Global heatmap type controls
@@ -82,14 +86,60 @@ def LaneHeatmapSimple(lane: int, matrix: IndexDistanceMatrix, index_type: str =
     if not matrix or len(matrix.sample_names) < 2:
         return None
 
+    total = len(matrix.sample_names)
+    notice = None
+    if total > MAX_HEATMAP_SAMPLES:
+        matrix = _highest_risk_submatrix(matrix, index_type, MAX_HEATMAP_SAMPLES)
+        notice = P(
+            f"Showing {MAX_HEATMAP_SAMPLES} of {total} samples: those with the "
+            f"lowest minimum distance (highest collision risk).",
+            cls="heatmap-description",
+        )
+
     return Div(
         H4(f"Lane {lane}", cls="lane-header"),
-        Span(f"({len(matrix.sample_names)} samples)", cls="lane-sample-count"),
+        Span(f"({total} samples)", cls="lane-sample-count"),
+        notice,
         IndexDistanceHeatmap(matrix, index_type),
         cls="lane-heatmap-simple",
     )
 
 
+def _highest_risk_submatrix(
+    matrix: IndexDistanceMatrix, index_type: str, limit: int
+) -> IndexDistanceMatrix:
+    """
+    Reduce a matrix to the `limit` samples with the lowest minimum distance.
+
+    Samples keep their original order. Samples without any distance (no
+    index of this type) rank last.
+    """
+    if index_type == "i7":
+        distances = matrix.i7_distances
+    elif index_type == "i5":
+        distances = matrix.i5_distances
+    else:  # combined
+        distances = matrix.combined_distances
+
+    no_distance = float("inf")
+    min_distances = [
+        min((d for d in row if d is not None), default=no_distance)
+        for row in distances
+    ]
+    keep = sorted(heapq.nsmallest(limit, range(len(min_distances)), key=min_distances.__getitem__))
+
+    def _slice(rows):
+        return [[rows[i][j] for j in keep] for i in keep]
+
+    return IndexDistanceMatrix(
+        sample_ids=[matrix.sample_ids[i] for i in keep],
+        sample_names=[matrix.sample_names[i] for i in keep],
+        i7_distances=_slice(matrix.i7_distances),
+        i5_distances=_slice(matrix.i5_distances),
+        combined_distances=_slice(matrix.combined_distances),
+    )
+
+
 def IndexDistanceHeatmap(matrix: IndexDistanceMatrix, index_type: str = "i7"):
     """
     Render index distances as an HTML table heatmap.
@@ -107,46 +157,63 @@ def IndexDistanceHeatmap(matrix: IndexDistanceMatrix, index_type: str = "i7"):
         distances = matrix.i5_distances
     else:  # combined
         distances = matrix.combined_distances
-    n = len(matrix.sample_names)
+
+    # Truncated names are shared by the header row and row headers
+    names = matrix.sample_names
+    display_names = [_truncate_name(name) for name in names]
 
     # Build header row
     header_cells = [Th("", cls="heatmap-corner")]
-    for name in matrix.sample_names:
-        # Truncate long names
-        display_name = name[:8] + ".." if len(name) > 8 else name
+    for name, display_name in zip(names, display_names):
         header_cells.append(Th(display_name, cls="heatmap-header", title=name))
 
     # Build data rows
     rows = [Tr(*header_cells, cls="heatmap-header-row")]
 
-    for i, row_name in enumerate(matrix.sample_names):
-        display_name = row_name[:8] + ".." if len(row_name) > 8 else row_name
-        row_cells = [Th(display_name, cls="heatmap-row-header", title=row_name)]
-
-        for j in range(n):
-            dist = distances[i][j]
-            if i == j:
-                # Diagonal
-                cell_cls = "heatmap-cell diagonal"
-                cell_content = "-"
-            elif dist is None:
-                cell_cls = "heatmap-cell no-data"
-                cell_content = "N/A"
-            else:
-                # Color based on distance (lower = more dangerous = redder)
-                dist_class = min(dist, 10)
-                cell_cls = f"heatmap-cell dist-{dist_class}"
-                cell_content = str(dist)
-
-            row_cells.append(Td(cell_content, cls=cell_cls, title=f"Distance: {dist}"))
-
-        rows.append(Tr(*row_cells))
+    for i, (row_name, display_name) in enumerate(zip(names, display_names)):
+        # Data cells hold only integers, so they are rendered as one
+        # pre-built string per row instead of one Td component per cell
+        cells_html = "".join([
+            _DIAGONAL_CELL if i == j else _distance_cell(dist)
+            for j, dist in enumerate(distances[i])
+        ])
+        rows.append(Tr(
+            Th(display_name, cls="heatmap-row-header", title=row_name),
+            NotStr(cells_html),
+        ))
 
     return Table(*rows, cls="heatmap-table")
 
 
+def _truncate_name(name: str) -> str:
+    """Shorten long sample names for heatmap headers."""
+    return name[:8] + ".." if len(name) > 8 else name
+
+
+_DIAGONAL_CELL = '<td class="heatmap-cell diagonal" title="Distance: None">-</td>'
+_NO_DATA_CELL = '<td class="heatmap-cell no-data" title="Distance: None">N/A</td>'
+
+
+def _format_distance_cell(dist: int) -> str:
+    return f'<td class="heatmap-cell dist-{min(dist, 10)}" title="Distance: {dist}">{dist}</td>'
+
+
+# Pre-rendered cells for every distance two 24bp+24bp index pairs can produce
+_DISTANCE_CELLS = tuple(_format_distance_cell(d) for d in range(49))
+
+
+def _distance_cell(dist) -> str:
+    """Heatmap cell HTML for an off-diagonal distance (lower = redder)."""
+    if dist is None:
+        return _NO_DATA_CELL
+    if dist < len(_DISTANCE_CELLS):
+        return _DISTANCE_CELLS[dist]
+    return _format_distance_cell(dist)
+
+
+@lru_cache(maxsize=1)
 def HeatmapLegend():
-    """Color legend for the heatmap."""
+    """Color legend for the heatmap (built once; callers must not mutate it)."""
     return Div(
         Span("Distance: ", cls="legend-label"),
         Span("0", cls="legend-item dist-0"),
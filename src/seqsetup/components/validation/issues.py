@@ -1,5 +1,7 @@
 """Validation issues tab: error/warning rendering and collision details."""
 
+from itertools import chain
+
 from fasthtml.common import *
 
 from ...models.validation import (
@@ -14,34 +16,27 @@ from ...models.validation import (
 
 def IssuesTabContent(result: ValidationResult):
     """Content for the Issues tab."""
-    errors = []
-
-    # Duplicate sample IDs are errors
-    for error in result.duplicate_sample_ids:
-        errors.append(("duplicate", error))
-
-    # Index collisions are errors
-    for collision in result.index_collisions:
-        errors.append(("collision", collision))
-
-    # Dark cycle errors
-    for dark_err in result.dark_cycle_errors:
-        errors.append(("dark_cycle", dark_err))
-
-    # Application profile errors
-    for app_err in result.application_errors:
-        errors.append(("application", app_err))
-
-    # Configuration errors
+    config_errors = []
+    config_warnings = []
     for cfg_err in result.configuration_errors:
         if cfg_err.severity == ValidationSeverity.ERROR:
-            errors.append(("config", cfg_err))
-
-    # Configuration warnings (separate list)
-    warnings = []
-    for cfg_err in result.configuration_errors:
-        if cfg_err.severity == ValidationSeverity.WARNING:
-            warnings.append(("config_warning", cfg_err))
+            config_errors.append(cfg_err)
+        elif cfg_err.severity == ValidationSeverity.WARNING:
+            config_warnings.append(cfg_err)
+
+    # Render each issue type with its own renderer, in display order:
+    # duplicates, collisions, dark cycles, application, configuration
+    errors = list(chain(
+        (_duplicate_item(error) for error in result.duplicate_sample_ids),
+        (_error_item(IndexCollisionDetail(c)) for c in result.index_collisions),
+        (_error_item(DarkCycleErrorDetail(e)) for e in result.dark_cycle_errors),
+        (_error_item(ApplicationErrorDetail(e)) for e in result.application_errors),
+        (_error_item(ConfigurationErrorDetail(e)) for e in config_errors),
+    ))
+    warnings = [
+        Div(ConfigurationErrorDetail(w), cls="validation-warning-item")
+        for w in config_warnings
+    ]
 
     if not errors and not warnings:
         return Div(
@@ -56,21 +51,11 @@ def IssuesTabContent(result: ValidationResult):
     sections = []
     if errors:
         sections.append(H3(f"Errors ({len(errors)})"))
-        sections.append(
-            Div(
-                *[_render_issue(err_type, err) for err_type, err in errors],
-                cls="validation-error-list",
-            )
-        )
+        sections.append(Div(*errors, cls="validation-error-list"))
 
     if warnings:
         sections.append(H3(f"Warnings ({len(warnings)})", style="margin-top: 1rem;"))
-        sections.append(
-            Div(
-                *[_render_issue(err_type, err) for err_type, err in warnings],
-                cls="validation-warning-list",
-            )
-        )
+        sections.append(Div(*warnings, cls="validation-warning-list"))
 
     return Div(
         *sections,
@@ -78,40 +63,18 @@ def IssuesTabContent(result: ValidationResult):
     )
 
 
-def _render_issue(err_type: str, err):
-    """Render a single validation issue item."""
-    if err_type == "duplicate":
-        return Div(
-            Span("Duplicate ID: ", cls="error-type"),
-            Span(err),
-            cls="validation-error-item",
-        )
-    elif err_type == "collision":
-        return Div(
-            IndexCollisionDetail(err),
-            cls="validation-error-item",
-        )
-    elif err_type == "dark_cycle":
-        return Div(
-            DarkCycleErrorDetail(err),
-            cls="validation-error-item",
-        )
-    elif err_type == "application":
-        return Div(
-            ApplicationErrorDetail(err),
-            cls="validation-error-item",
-        )
-    elif err_type == "config":
-        return Div(
-            ConfigurationErrorDetail(err),
-            cls="validation-error-item",
-        )
-    elif err_type == "config_warning":
-        return Div(
-            ConfigurationErrorDetail(err),
-            cls="validation-warning-item",
-        )
-    return None
+def _duplicate_item(error: str):
+    """Render a duplicate sample ID error item."""
+    return Div(
+        Span("Duplicate ID: ", cls="error-type"),
+        Span(error),
+        cls="validation-error-item",
+    )
+
+
+def _error_item(detail):
+    """Wrap an error detail component as an error list item."""
+    return Div(detail, cls="validation-error-item")
 
 
 def DarkCycleErrorDetail(error: DarkCycleError):
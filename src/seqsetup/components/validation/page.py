@@ -7,13 +7,26 @@ from fasthtml.common import *
 from ...models.sequencing_run import SequencingRun
 from ...models.user import User
 from ...models.validation import ValidationResult
-from ...services.validation import ValidationService
+from ...services.validation import (
+    SECTION_COLOR_BALANCE,
+    SECTION_DARK_CYCLES,
+    SECTION_MATRICES,
+    ValidationService,
+)
 from ..layout import AppShell
 from .issues import IssuesTabContent
 from .heatmaps import HeatmapsTabContent
 from .color_balance import ColorBalanceTabContent, DarkCyclesTabContent
 
 
+# Optional validation sections each tab's content needs (see ValidationService.validate_run)
+_TAB_SECTIONS = {
+    "heatmaps": {SECTION_MATRICES},
+    "colorbalance": {SECTION_COLOR_BALANCE},
+    "darkcycles": {SECTION_DARK_CYCLES},
+}
+
+
 def ValidationPage(run: SequencingRun, user: Optional[User] = None, active_tab: str = "issues", result: Optional[ValidationResult] = None):
     """
     Full validation page wrapped in AppShell with tabbed layout.
@@ -25,7 +38,7 @@ def ValidationPage(run: SequencingRun, user: Optional[User] = None, active_tab:
         result: Pre-computed validation result (if None, runs basic validation without profile checks)
     """
     if result is None:
-        result = ValidationService.validate_run(run)
+        result = ValidationService.validate_run(run, sections=_TAB_SECTIONS.get(active_tab, ()))
 
     return AppShell(
         user=user,
@@ -51,8 +64,8 @@ def ValidationPage(run: SequencingRun, user: Optional[User] = None, active_tab:
 def ValidationApprovalBar(run: SequencingRun, result: ValidationResult):
     """Approval bar showing validation status and approve/unapprove button."""
     can_approve = (
-        result.error_count == 0
-        and run.has_samples
+        run.has_samples
+        and result.error_count == 0
         and run.all_samples_have_indexes
     )
 
@@ -101,13 +114,16 @@ def ValidationTabs(run_id: str, result: ValidationResult, active_tab: str = "iss
         result: Validation result
         active_tab: "issues", "heatmaps", "colorbalance", or "darkcycles"
         index_type: "i7", "i5", or "combined" for heatmaps
+
+    Sections skipped when validating (None on the result) keep their tab
+    buttons enabled, without a count.
     """
     error_count = result.error_count
     warning_count = result.warning_count
     issue_count = error_count + warning_count
-    has_matrices = bool(result.distance_matrices)
-    has_color_balance = bool(result.color_balance)
-    color_balance_issues = result.color_balance_issue_count
+    has_matrices = result.distance_matrices is None or bool(result.distance_matrices)
+    has_color_balance = result.color_balance is None or bool(result.color_balance)
+    color_balance_issues = result.color_balance_issue_count or 0
     color_balance_enabled = result.color_balance_enabled
 
     # Determine tab content
@@ -37,6 +37,7 @@ from .index_panel import (
     DraggableIndexPairCompact,
     IndexKitDropdown,
     IndexKitPanel,
+    IndexKitPanelLoader,
     IndexKitSectionCompact,
     IndexListCompact,
 )
@@ -76,6 +77,7 @@ __all__ = [
     "IndexKitSectionCompact",
     "IndexKitDropdown",
     "IndexKitPanel",
+    "IndexKitPanelLoader",
     "IndexListCompact",
     "DraggableIndexPairCompact",
     "DraggableIndexCompact",
@@ -6,7 +6,7 @@ from ...models.index import IndexKit
 from ...models.sequencing_run import SequencingRun
 from .steps import WizardStepIndicator
 from .sample_table import SamplePasteFormatHelp, FetchFromApiSection, NewSamplesTableWizard
-from .index_panel import IndexKitDropdown, IndexKitPanel
+from .index_panel import IndexKitDropdown, IndexKitPanelLoader
 
 
 def AddSamplesWizardProgress(current_step: int, run_id: str):
@@ -151,12 +151,8 @@ def AddSamplesStep2(run: SequencingRun, index_kits: list[IndexKit], existing_sam
                 # Index kits panel on the left
                 Aside(
                     H3("Available Indexes"),
-                    IndexKitDropdown(index_kits, default_kit.name if default_kit else None),
-                    Div(
-                        IndexKitPanel(default_kit) if default_kit else P("No index kits available.", cls="no-kits-message"),
-                        cls="index-kits-compact",
-                        id="index-list-container",
-                    ),
+                    IndexKitDropdown(index_kits, default_kit.kit_id if default_kit else None),
+                    IndexKitPanelLoader(default_kit),
                     cls="wizard-index-panel",
                 ) if new_samples and not all_have_indexes else None,
                 # Sample table on the right with drop zones (no bulk actions in this wizard)
@@ -1,5 +1,7 @@
 """Index kit display and drag-drop components for the wizard."""
 
+from urllib.parse import quote
+
 from fasthtml.common import *
 
 from ...models.index import IndexKit, IndexMode
@@ -8,7 +10,7 @@ from ..index_panel import (
     DraggableIndexPair,
     SingleIndexContent,
 )
-from ...utils.html import escape_html_attr, escape_js_string
+from ...utils.html import escape_html_attr, escape_js_string, options_html
 
 
 def IndexKitSectionCompact(kit: IndexKit):
@@ -45,20 +47,20 @@ def IndexKitSectionCompact(kit: IndexKit):
     )
 
 
-def IndexKitDropdown(index_kits: list[IndexKit], selected_kit_name: str = None):
-    """Dropdown to select which index kit to display."""
+def IndexKitDropdown(index_kits: list[IndexKit], selected_kit_id: str = None):
+    """Dropdown to select which index kit to display.
+
+    Option values are kit ids (name:version), the key /indexes/kit-content
+    looks kits up by, so the selection is matched on kit_id as well.
+    """
     if not index_kits:
         return None
 
     return Select(
-        *[
-            Option(
-                f"{kit.name} v{kit.version} ({_get_kit_count(kit)} indexes)",
-                value=kit.kit_id,
-                selected=kit.kit_id == selected_kit_name,
-            )
+        NotStr(options_html(
+            (kit.kit_id, f"{kit.name} v{kit.version} ({_get_kit_count(kit)} indexes)", kit.kit_id == selected_kit_id)
             for kit in index_kits
-        ],
+        )),
         name="selected_kit",
         id="index-kit-dropdown",
         hx_get="/indexes/kit-content",
@@ -79,6 +81,34 @@ def _get_kit_count(kit: IndexKit) -> int:
         return len(kit.index_pairs)
 
 
+def IndexKitPanelLoader(kit: IndexKit):
+    """
+    Container for the wizard index list that fetches its panel after page load.
+
+    The kit panel can hold hundreds of draggable indexes, so it is loaded from
+    ``/indexes/kit-content`` (the same fragment the kit dropdown swaps in)
+    instead of being rendered into the step page.
+
+    Args:
+        kit: Index kit to load, or None if no kits are available
+    """
+    if kit is None:
+        return Div(
+            P("No index kits available.", cls="no-kits-message"),
+            cls="index-kits-compact",
+            id="index-list-container",
+        )
+
+    return Div(
+        P("Loading indexes...", cls="no-kits-message"),
+        hx_get=f"/indexes/kit-content?selected_kit={quote(kit.kit_id, safe='')}",
+        hx_trigger="load",
+        hx_swap="innerHTML",
+        cls="index-kits-compact",
+        id="index-list-container",
+    )
+
+
 def IndexKitPanel(kit: IndexKit):
     """
     Index kit panel with details, filter, and index list.
@@ -146,13 +176,15 @@ def IndexListCompact(kit: IndexKit):
     if kit is None:
         return P("Select an index kit", cls="no-kits-message")
 
+    # Kits can hold hundreds of indexes; each list is rendered as one
+    # joined HTML string rather than one component tree per index.
     if kit.is_combinatorial():
         # For combinatorial, show i7 and i5 in separate sections
         return Div(
             Div(
                 Strong("i7 Indexes", cls="index-subsection-header"),
                 Div(
-                    *[DraggableIndexCompact(idx, kit.name, "i7") for idx in kit.i7_indexes],
+                    NotStr(_draggable_indexes_html(kit.i7_indexes, kit.name, "i7")),
                     cls="index-list",
                 ),
                 cls="index-subsection i7-section",
@@ -160,7 +192,7 @@ def IndexListCompact(kit: IndexKit):
             Div(
                 Strong("i5 Indexes", cls="index-subsection-header"),
                 Div(
-                    *[DraggableIndexCompact(idx, kit.name, "i5") for idx in kit.i5_indexes],
+                    NotStr(_draggable_indexes_html(kit.i5_indexes, kit.name, "i5")),
                     cls="index-list",
                 ),
                 cls="index-subsection i5-section",
@@ -171,82 +203,106 @@ def IndexListCompact(kit: IndexKit):
     elif kit.is_single():
         # Single mode - only i7
         return Div(
-            *[DraggableIndexCompact(idx, kit.name, "i7") for idx in kit.i7_indexes],
+            NotStr(_draggable_indexes_html(kit.i7_indexes, kit.name, "i7")),
             cls="index-list",
             id="index-list-items",
         )
     else:
         # Unique dual - show pairs with i7/i5 side by side
         return Div(
-            *[DraggableIndexPairCompact(pair) for pair in kit.index_pairs],
+            NotStr("".join(_draggable_pair_html(pair) for pair in kit.index_pairs)),
             cls="index-list",
             id="index-list-items",
         )
 
 
+# Draggable index markup. All substituted values must already be escaped.
+_DRAGGABLE_PAIR_TEMPLATE = (
+    '<div class="draggable-index-compact draggable-pair" draggable="true"'
+    ' data-index-pair-id="{id}" data-index-name="{name}" data-index-type="pair" data-well="{well}"'
+    " onclick=\"handleIndexClick(event, '{js_id}', 'pair')\""
+    " ondragstart=\"handleDragStart(event, '{js_id}', 'pair')\""
+    ' title="{title}">{content}</div>'
+)
+
+_DRAGGABLE_INDEX_TEMPLATE = (
+    '<div class="draggable-index-compact draggable-single {index_type}-index" draggable="true"'
+    ' data-index-id="{id}" data-index-name="{name}" data-index-type="{index_type}"'
+    ' data-kit-name="{kit_name}" data-well="{well}"'
+    " onclick=\"handleIndexClick(event, '{js_id}', '{index_type}')\""
+    " ondragstart=\"handleDragStart(event, '{js_id}', '{index_type}')\""
+    ' title="{title}"><span class="index-name-compact">{name}</span>{well_span}</div>'
+)
+
+
 def DraggableIndexPairCompact(pair):
     """Compact draggable index pair showing pair name, index names, and well position."""
-    from ...models.index import IndexPair
+    return NotStr(_draggable_pair_html(pair))
 
-    # Escape user data for safe use in JavaScript event handlers
-    safe_id = escape_js_string(pair.id)
-    safe_name = escape_html_attr(pair.name)
 
+def _draggable_pair_html(pair) -> str:
+    """Render a compact draggable index pair to HTML."""
     # Get index names
     i7_name = pair.index1.name if pair.index1 else ""
     i5_name = pair.index2.name if pair.index2 else ""
+    name = escape_html_attr(pair.name)
+    well = escape_html_attr(pair.well_position)
 
     # Build display elements
-    elements = [Span(pair.name, cls="index-name-compact")]
-
+    content = f'<span class="index-name-compact">{name}</span>'
     # Show i7/i5 names if different from pair name
     if i7_name and i7_name != pair.name:
-        elements.append(Span(i7_name, cls="index-i7-name-compact"))
+        content += f'<span class="index-i7-name-compact">{escape_html_attr(i7_name)}</span>'
     if i5_name and i5_name != pair.name:
-        elements.append(Span(i5_name, cls="index-i5-name-compact"))
-
+        content += f'<span class="index-i5-name-compact">{escape_html_attr(i5_name)}</span>'
     # Show well position if available
-    if pair.well_position:
-        elements.append(Span(pair.well_position, cls="index-well-compact"))
+    if well:
+        content += f'<span class="index-well-compact">{well}</span>'
 
-    return Div(
-        *elements,
-        cls="draggable-index-compact draggable-pair",
-        draggable="true",
-        data_index_pair_id=pair.id,
-        data_index_name=pair.name,
-        data_index_type="pair",
-        data_well=pair.well_position or "",
-        onclick=f"handleIndexClick(event, '{safe_id}', 'pair')",
-        ondragstart=f"handleDragStart(event, '{safe_id}', 'pair')",
-        title=f"Pair: {safe_name}\ni7: {i7_name} ({pair.index1_sequence})\ni5: {i5_name} ({pair.index2_sequence or 'N/A'})\nWell: {pair.well_position or 'N/A'}",
+    title = (
+        f"Pair: {pair.name}\ni7: {i7_name} ({pair.index1_sequence})"
+        f"\ni5: {i5_name} ({pair.index2_sequence or 'N/A'})\nWell: {pair.well_position or 'N/A'}"
+    )
+    return _DRAGGABLE_PAIR_TEMPLATE.format(
+        id=escape_html_attr(pair.id),
+        name=name,
+        well=well,
+        # Escape for the JS string literal, then for the HTML attribute
+        js_id=escape_html_attr(escape_js_string(pair.id)),
+        title=escape_html_attr(title),
+        content=content,
     )
 
 
 def DraggableIndexCompact(index, kit_name: str, index_type: str):
     """Compact draggable individual index (for combinatorial/single mode)."""
-    from ...models.index import Index, IndexType
+    return NotStr(_draggable_index_html(index, escape_html_attr(kit_name), kit_name, index_type))
 
-    index_id = f"{kit_name}_{index_type}_{index.name}"
 
-    # Escape user data for safe use in JavaScript event handlers
-    safe_index_id = escape_js_string(index_id)
-    safe_name = escape_html_attr(index.name)
+def _draggable_indexes_html(indexes, kit_name: str, index_type: str) -> str:
+    """Render a list of compact draggable indexes from one kit to HTML."""
+    # The kit name is the same for every entry; escape it once
+    escaped_kit_name = escape_html_attr(kit_name)
+    return "".join(
+        _draggable_index_html(index, escaped_kit_name, kit_name, index_type)
+        for index in indexes
+    )
 
-    # Show well position if available, otherwise nothing
-    well_display = Span(index.well_position, cls="index-well-compact") if index.well_position else None
 
-    return Div(
-        Span(index.name, cls="index-name-compact"),
-        well_display,
-        cls=f"draggable-index-compact draggable-single {index_type}-index",
-        draggable="true",
-        data_index_id=index_id,
-        data_index_name=index.name,
-        data_index_type=index_type,
-        data_kit_name=kit_name,
-        data_well=index.well_position or "",
-        onclick=f"handleIndexClick(event, '{safe_index_id}', '{index_type}')",
-        ondragstart=f"handleDragStart(event, '{safe_index_id}', '{index_type}')",
-        title=f"{safe_name}\nWell: {index.well_position or 'N/A'}\nSequence: {index.sequence}",
+def _draggable_index_html(index, escaped_kit_name: str, kit_name: str, index_type: str) -> str:
+    """Render a compact draggable individual index to HTML."""
+    index_id = f"{kit_name}_{index_type}_{index.name}"
+    well = escape_html_attr(index.well_position)
+
+    return _DRAGGABLE_INDEX_TEMPLATE.format(
+        index_type=index_type,
+        id=escape_html_attr(index_id),
+        name=escape_html_attr(index.name),
+        kit_name=escaped_kit_name,
+        well=well,
+        # Escape for the JS string literal, then for the HTML attribute
+        js_id=escape_html_attr(escape_js_string(index_id)),
+        title=escape_html_attr(f"{index.name}\nWell: {index.well_position or 'N/A'}\nSequence: {index.sequence}"),
+        # Show well position if available, otherwise nothing
+        well_span=f'<span class="index-well-compact">{well}</span>' if well else "",
     )
@@ -1,13 +1,22 @@
 """Sample table, paste/import, and bulk action components for the wizard."""
 
+from dataclasses import dataclass
+from functools import lru_cache
+
 from fasthtml.common import *
 
 from ...models.index import IndexKit
 from ...models.sequencing_run import SequencingRun
+from ...utils.html import escape_html_attr, options_html
 
 
 def SamplePasteFormatHelp():
     """Collapsible section showing paste format examples for sample data."""
+    return _PASTE_FORMAT_HELP
+
+
+def _build_paste_format_help():
+    """Build the (static) paste format help section."""
     return Details(
         Summary("Paste Format Help", cls="format-help-summary"),
         Div(
@@ -69,6 +78,10 @@ def SamplePasteFormatHelp():
     )
 
 
+# The paste format help has no dynamic content; serialize it once at import
+_PASTE_FORMAT_HELP = NotStr(to_xml(_build_paste_format_help()))
+
+
 def FetchFromApiSection(run_id: str, target: str = "#sample-table", context: str = "", existing_ids: str = ""):
     """Section with worklist fetch flow: load worklists, pick one, import samples."""
     params = []
@@ -128,13 +141,10 @@ def WorklistSelector(run_id: str, worklists: list[dict], context: str = "", exis
     return Div(
         Div(
             Select(
-                *[
-                    Option(
-                        _format_worklist_option(wl),
-                        value=wl["id"],
-                    )
+                NotStr(options_html(
+                    (wl["id"], _format_worklist_option(wl), False)
                     for wl in worklists
-                ],
+                )),
                 name="worklist_id",
                 id="worklist-select",
                 cls="index-kit-dropdown",
@@ -252,6 +262,63 @@ def BulkPasteSectionWizard(run_id: str, sample_api_enabled: bool = False):
     )
 
 
+# The header depends only on which columns are shown, so each combination is
+# rendered once and shared across requests
+@lru_cache(maxsize=16)
+def _sample_table_header(show_drop_zones: bool, show_i5_column: bool, show_bulk_actions: bool, editable: bool):
+    """Pre-rendered <thead> for SampleTableWizard."""
+    effective_bulk_actions = show_bulk_actions and editable
+    header_cells = []
+    # Only show checkbox column if bulk actions are enabled and editable
+    if effective_bulk_actions:
+        header_cells.append(
+            Th(
+                Input(type="checkbox", cls="select-all-checkbox", onclick="toggleSelectAllSamples(this)"),
+                cls="checkbox-cell",
+            )
+        )
+    header_cells.extend([
+        Th("Sample ID"),
+        Th("Test ID"),
+        Th("Worksheet"),
+    ])
+    if show_drop_zones:
+        header_cells.append(Th("Index Kit"))
+        header_cells.append(Th("Index (i7)"))
+        if show_i5_column:
+            header_cells.append(Th("Index (i5)"))
+        # Show lanes, override cycles, mismatches columns when bulk actions is enabled (read-only when not editable)
+        if show_bulk_actions:
+            header_cells.append(Th("Lanes"))
+            header_cells.append(Th("Override Cycles"))
+            header_cells.append(Th("MM i7", title="Barcode Mismatches Index 1"))
+            header_cells.append(Th("MM i5", title="Barcode Mismatches Index 2"))
+    # Only show actions column if editable
+    if editable:
+        header_cells.append(Th("", cls="actions-col"))  # Minimal width for delete button
+    return NotStr(to_xml(Thead(Tr(*header_cells))))
+
+
+@lru_cache(maxsize=2)
+def _new_samples_table_header(show_i5_column: bool):
+    """Pre-rendered <thead> for NewSamplesTableWizard."""
+    header_cells = [
+        Th(
+            Input(type="checkbox", cls="select-all-checkbox", onclick="toggleSelectAllSamples(this)"),
+            cls="checkbox-cell",
+        ),
+        Th("Sample ID"),
+        Th("Test ID"),
+        Th("Worksheet"),
+        Th("Index Kit"),
+        Th("Index (i7)"),
+    ]
+    if show_i5_column:
+        header_cells.append(Th("Index (i5)"))
+    header_cells.append(Th("", cls="actions-col"))  # Minimal width for delete button
+    return NotStr(to_xml(Thead(Tr(*header_cells))))
+
+
 def SampleTableWizard(run: SequencingRun, show_drop_zones: bool = False, index_kits: list[IndexKit] = None, num_lanes: int = 1, show_bulk_actions: bool = True, context: str = "", test_profiles: list = None, editable: bool = True):
     """Sample table for wizard with run_id in paths.
 
@@ -283,47 +350,18 @@ def SampleTableWizard(run: SequencingRun, show_drop_zones: bool = False, index_k
     # Disable bulk actions if not editable
     effective_bulk_actions = show_bulk_actions and editable
 
-    header_cells = []
-    # Only show checkbox column if bulk actions are enabled and editable
-    if effective_bulk_actions:
-        header_cells.append(
-            Th(
-                Input(type="checkbox", cls="select-all-checkbox", onclick="toggleSelectAllSamples(this)"),
-                cls="checkbox-cell",
-            )
-        )
-    header_cells.extend([
-        Th("Sample ID"),
-        Th("Test ID"),
-        Th("Worksheet"),
-    ])
-    if show_drop_zones:
-        header_cells.append(Th("Index Kit"))
-        header_cells.append(Th("Index (i7)"))
-        if show_i5_column:
-            header_cells.append(Th("Index (i5)"))
-        # Show lanes, override cycles, mismatches columns when bulk actions is enabled (read-only when not editable)
-        if show_bulk_actions:
-            header_cells.append(Th("Lanes"))
-            header_cells.append(Th("Override Cycles"))
-            header_cells.append(Th("MM i7", title="Barcode Mismatches Index 1"))
-            header_cells.append(Th("MM i5", title="Barcode Mismatches Index 2"))
-    # Only show actions column if editable
-    if editable:
-        header_cells.append(Th("", cls="actions-col"))  # Minimal width for delete button
-
     # Bulk action panel for lane assignment (only if enabled and editable)
     bulk_action_panel = BulkLaneAssignmentPanel(run.id, num_lanes, test_profiles) if effective_bulk_actions else None
 
     return Div(
         bulk_action_panel,
         Table(
-            Thead(Tr(*header_cells)),
+            _sample_table_header(show_drop_zones, show_i5_column, show_bulk_actions, editable),
             Tbody(
-                *[
-                    SampleRowWizard(sample, run.id, run.run_cycles, show_drop_zones, show_i5_column, num_lanes, show_bulk_actions, context, editable)
+                NotStr("".join([
+                    _sample_row_wizard_html(sample, run.id, show_drop_zones, show_i5_column, show_bulk_actions, context, editable, None)
                     for sample in run.samples
-                ]
+                ]))
             ),
             cls="sample-table",
         ),
@@ -358,29 +396,14 @@ def NewSamplesTableWizard(run: SequencingRun, samples: list, index_kits: list[In
     if index_kits:
         show_i5_column = any(not kit.is_single() for kit in index_kits)
 
-    header_cells = [
-        Th(
-            Input(type="checkbox", cls="select-all-checkbox", onclick="toggleSelectAllSamples(this)"),
-            cls="checkbox-cell",
-        ),
-        Th("Sample ID"),
-        Th("Test ID"),
-        Th("Worksheet"),
-        Th("Index Kit"),
-        Th("Index (i7)"),
-    ]
-    if show_i5_column:
-        header_cells.append(Th("Index (i5)"))
-    header_cells.append(Th("", cls="actions-col"))  # Minimal width for delete button
-
     return Div(
         Table(
-            Thead(Tr(*header_cells)),
+            _new_samples_table_header(show_i5_column),
             Tbody(
-                *[
-                    SampleRowWizard(sample, run.id, run.run_cycles, show_drop_zones=True, show_i5_column=show_i5_column, num_lanes=1, show_bulk_actions=False, context=context, show_checkboxes=True)
+                NotStr("".join([
+                    _sample_row_wizard_html(sample, run.id, True, show_i5_column, False, context, True, True)
                     for sample in samples
-                ]
+                ]))
             ),
             cls="sample-table",
         ),
@@ -412,53 +435,6 @@ def BulkLaneAssignmentPanel(run_id: str, num_lanes: int, test_profiles: list = N
     ]
 
     return Div(
-        # Hidden forms for HTMX submission
-        Form(
-            Input(type="hidden", name="sample_ids", id="bulk-sample-ids"),
-            Input(type="hidden", name="lanes", id="bulk-lanes"),
-            hx_post=f"/runs/{run_id}/samples/set-lanes",
-            hx_target="#sample-table",
-            hx_swap="outerHTML",
-            id="bulk-lanes-form",
-            style="display: none;",
-        ),
-        Form(
-            Input(type="hidden", name="sample_ids", id="bulk-mismatch-sample-ids"),
-            Input(type="hidden", name="mismatch_index1", id="bulk-mismatch-index1"),
-            Input(type="hidden", name="mismatch_index2", id="bulk-mismatch-index2"),
-            hx_post=f"/runs/{run_id}/samples/set-mismatches",
-            hx_target="#sample-table",
-            hx_swap="outerHTML",
-            id="bulk-mismatches-form",
-            style="display: none;",
-        ),
-        Form(
-            Input(type="hidden", name="sample_ids", id="bulk-override-sample-ids"),
-            Input(type="hidden", name="override_cycles", id="bulk-override-cycles"),
-            hx_post=f"/runs/{run_id}/samples/set-override-cycles",
-            hx_target="#sample-table",
-            hx_swap="outerHTML",
-            id="bulk-override-form",
-            style="display: none;",
-        ),
-        Form(
-            Input(type="hidden", name="sample_ids", id="bulk-test-id-sample-ids"),
-            Input(type="hidden", name="test_id", id="bulk-test-id"),
-            hx_post=f"/runs/{run_id}/samples/set-test-id",
-            hx_target="#sample-table",
-            hx_swap="outerHTML",
-            id="bulk-test-id-form",
-            style="display: none;",
-        ),
-        Form(
-            Input(type="hidden", name="sample_ids", id="bulk-delete-sample-ids"),
-            hx_post=f"/runs/{run_id}/samples/bulk-delete",
-            hx_target="#sample-table",
-            hx_swap="outerHTML",
-            hx_confirm="Delete selected samples?",
-            id="bulk-delete-form",
-            style="display: none;",
-        ),
         # Header row with selection count and delete button
         Div(
             Span("0", id="selected-sample-count", cls="selected-count"),
@@ -537,6 +513,9 @@ def BulkLaneAssignmentPanel(run_id: str, num_lanes: int, test_profiles: list = N
         ),
         cls="bulk-action-panel",
         id="bulk-action-panel",
+        # Base URL for the bulk endpoints; app.js posts the selected sample
+        # ids to {url}/set-lanes, /set-mismatches, etc. (see submitBulkAction)
+        data_bulk_url=f"/runs/{run_id}/samples",
     )
 
 
@@ -569,6 +548,69 @@ def _TestIdDropdown(test_profiles: list = None):
     )
 
 
+# Wizard sample row markup. All substituted values must already be escaped.
+_WIZARD_ROW_TEMPLATE = '<tr class="{row_cls}" id="sample-row-{uid}">{cells}</tr>'
+
+_CHECKBOX_CELL_TEMPLATE = (
+    '<td class="checkbox-cell">'
+    '<input type="checkbox" data-sample-id="{uid}" onclick="handleSampleCheckboxClick(event)" class="sample-checkbox">'
+    '</td>'
+)
+
+_CLEAR_INDEX_TEMPLATE = (
+    '<button hx-post="{sample_url}/clear-index?index_type={index_type}{ctx_amp}"'
+    ' hx-target="{row_target}" hx-swap="outerHTML" class="btn-tiny btn-clear"'
+    ' title="Clear {index_type} index">x</button>'
+)
+
+# Drag events are handled by the delegated listeners in app.js, which read
+# the drop target from the data-drop-* attributes
+_INDEX_DROP_TEMPLATE = (
+    '<td><div data-context="{context}" data-drop-sample-id="{uid}" data-drop-run-id="{run_id}"'
+    ' data-drop-type="{index_type}" class="drop-zone {index_type}-drop">Drop {index_type}</div></td>'
+)
+
+_NO_INDEX_CELL = '<td class="index-cell"><span class="no-index">-</span></td>'
+
+_SETTINGS_INPUT_ATTRS = (
+    'hx-post="{sample_url}/settings" hx-target="{row_target}"'
+    ' hx-swap="outerHTML" hx-trigger="change"'
+)
+
+_OVERRIDE_INPUT_TEMPLATE = (
+    '<td class="override-cell"><input type="text" name="override_cycles" value="{value}"'
+    ' placeholder="Auto" ' + _SETTINGS_INPUT_ATTRS + ' class="override-cycles-input"></td>'
+)
+
+_MISMATCH_INPUT_TEMPLATE = (
+    '<td class="mismatch-cell"><input type="number" name="{name}" value="{value}"'
+    ' placeholder="-" min="0" max="2" ' + _SETTINGS_INPUT_ATTRS + ' class="mismatch-input"></td>'
+)
+
+_DELETE_CELL_TEMPLATE = (
+    '<td class="actions"><button hx-delete="{url}" hx-target="{target}" hx-swap="outerHTML"'
+    ' hx-confirm="Delete this sample?" class="btn-tiny btn-danger" title="Delete sample">\u00d7</button></td>'
+)
+
+
+def _assigned_index_cell(name, well, sequence: str, index_type: str, clear_button: str) -> str:
+    """Render the cell for an assigned i7/i5 index (name, well, truncated sequence)."""
+    seq = sequence[:8] + ("..." if len(sequence) > 8 else "")
+    return (
+        '<td class="index-cell"><div class="index-assigned">'
+        + (f'<span class="index-name-display">{escape_html_attr(name)}</span>' if name else "")
+        + (f'<span class="index-well-display">{escape_html_attr(well)}</span>' if well else "")
+        + f'<span class="assigned-index {index_type}">{escape_html_attr(seq)}</span>'
+        + clear_button
+        + "</div></td>"
+    )
+
+
+def _mismatch_display(value) -> str:
+    """Format an optional barcode mismatch count ("" when unset)."""
+    return str(value) if value is not None else ""
+
+
 def SampleRowWizard(sample, run_id: str, run_cycles, show_drop_zones: bool = False, show_i5_column: bool = True, num_lanes: int = 1, show_bulk_actions: bool = True, context: str = "", editable: bool = True, show_checkboxes: bool = None):
     """Sample row for wizard with run_id in paths.
 
@@ -584,271 +626,158 @@ def SampleRowWizard(sample, run_id: str, run_cycles, show_drop_zones: bool = Fal
         editable: Whether the row allows editing (delete button, etc.)
         show_checkboxes: Whether to show selection checkboxes. None = derive from show_bulk_actions and editable.
     """
-    # Build context query string for HTMX endpoints
-    ctx_param = f"?context={context}" if context else ""
-    has_index = sample.has_index
-    has_i7 = sample.index1_sequence is not None
-    has_i5 = sample.index2_sequence is not None
+    return NotStr(_sample_row_wizard_html(
+        sample, run_id, show_drop_zones, show_i5_column, show_bulk_actions, context, editable, show_checkboxes,
+    ))
+
+
+@dataclass(frozen=True, slots=True)
+class _WizardRowView:
+    """Flat, hashable snapshot of the sample fields a wizard row displays."""
+
+    uid: str
+    sample_id: str
+    test_id: str
+    worksheet_id: str
+    has_index: bool
+    index_kit_name: str | None
+    index1_sequence: str | None
+    index1_name: str | None
+    index1_well_position: str | None
+    index2_sequence: str | None
+    index2_name: str | None
+    index2_well_position: str | None
+    lanes_display: str
+    override_cycles: str | None
+    barcode_mismatches_index1: int | None
+    barcode_mismatches_index2: int | None
+
+    @classmethod
+    def from_sample(cls, sample) -> "_WizardRowView":
+        """Read the displayed fields (and derived index properties) once."""
+        return cls(
+            uid=sample.id,
+            sample_id=sample.sample_id,
+            test_id=sample.test_id,
+            worksheet_id=sample.worksheet_id,
+            has_index=sample.has_index,
+            index_kit_name=sample.index_kit_name,
+            index1_sequence=sample.index1_sequence,
+            index1_name=sample.index1_name,
+            index1_well_position=sample.index1_well_position,
+            index2_sequence=sample.index2_sequence,
+            index2_name=sample.index2_name,
+            index2_well_position=sample.index2_well_position,
+            lanes_display=sample.lanes_display,
+            override_cycles=sample.override_cycles,
+            barcode_mismatches_index1=sample.barcode_mismatches_index1,
+            barcode_mismatches_index2=sample.barcode_mismatches_index2,
+        )
 
-    row_class = "sample-row has-index" if has_index else "sample-row"
 
+def _sample_row_wizard_html(sample, run_id: str, show_drop_zones: bool, show_i5_column: bool, show_bulk_actions: bool, context: str, editable: bool, show_checkboxes) -> str:
+    """Rendered HTML for one wizard sample row (cached on its displayed fields)."""
     # Checkbox for selection (decoupled from bulk actions)
     effective_checkboxes = show_checkboxes if show_checkboxes is not None else (show_bulk_actions and editable)
-    checkbox_cell = None
-    if effective_checkboxes:
-        checkbox_cell = Td(
-            Input(
-                type="checkbox",
-                cls="sample-checkbox",
-                data_sample_id=sample.id,
-                onclick="handleSampleCheckboxClick(event)",
-            ),
-            cls="checkbox-cell",
-        )
+    return _render_wizard_row(
+        _WizardRowView.from_sample(sample), run_id, show_drop_zones, show_i5_column,
+        show_bulk_actions, context, editable, effective_checkboxes,
+    )
+
+
+# Rendered row HTML keyed on every displayed sample field plus the table
+# options. The key is the content itself, so an edited sample simply maps to
+# a new entry and no explicit invalidation is needed.
+@lru_cache(maxsize=4096)
+def _render_wizard_row(view: _WizardRowView, run_id: str, show_drop_zones: bool, show_i5_column: bool, show_bulk_actions: bool, context: str, editable: bool, show_checkboxes: bool) -> str:
+    """Render one wizard sample row straight to an HTML string.
+
+    Tables render hundreds of these, so the row is formatted from string
+    templates rather than built as an FT tree and serialized.
+    """
+    uid = escape_html_attr(view.uid)
+    esc_run_id = escape_html_attr(run_id)
+    # Per-row URL prefix and swap target, shared by every cell below
+    sample_url = f"/runs/{esc_run_id}/samples/{uid}"
+    row_target = f"#sample-row-{uid}"
+    esc_context = escape_html_attr(context)
+    row_class = "sample-row has-index" if view.has_index else "sample-row"
+
+    cells = [_CHECKBOX_CELL_TEMPLATE.format(uid=uid)] if show_checkboxes else []
+    cells.append(
+        f"<td>{escape_html_attr(view.sample_id)}</td>"
+        f"<td>{escape_html_attr(view.test_id)}</td>"
+        f'<td class="worksheet-cell">{escape_html_attr(view.worksheet_id) or "-"}</td>'
+    )
 
     if show_drop_zones:
-        # i7 column - show assigned name+sequence or drop zone
-        if has_i7:
-            i7_name = sample.index1_name or ""
-            i7_well = sample.index1_well_position
-            i7_seq = sample.index1_sequence[:8] + ("..." if len(sample.index1_sequence) > 8 else "")
-            # Only show clear button in wizard views (not in run view where show_bulk_actions=True)
-            clear_button = None
-            if not show_bulk_actions:
-                clear_i7_url = f"/runs/{run_id}/samples/{sample.id}/clear-index?index_type=i7" + (f"&context={context}" if context else "")
-                clear_button = Button(
-                    "x",
-                    hx_post=clear_i7_url,
-                    hx_target=f"#sample-row-{sample.id}",
-                    hx_swap="outerHTML",
-                    cls="btn-tiny btn-clear",
-                    title="Clear i7 index",
-                )
-            index_i7 = Td(
-                Div(
-                    Span(i7_name, cls="index-name-display") if i7_name else None,
-                    Span(i7_well, cls="index-well-display") if i7_well else None,
-                    Span(i7_seq, cls="assigned-index i7"),
-                    clear_button,
-                    cls="index-assigned",
-                ),
-                cls="index-cell",
-            )
+        # Index kit name cell
+        if view.index_kit_name:
+            kit_name = f'<span class="kit-name-display">{escape_html_attr(view.index_kit_name)}</span>'
         else:
-            if editable:
-                index_i7 = Td(
-                    Div(
-                        "Drop i7",
-                        cls="drop-zone i7-drop",
-                        data_context=context,
-                        ondragover="event.preventDefault(); this.classList.add('drag-over')",
-                        ondragleave="this.classList.remove('drag-over')",
-                        ondrop=f"handleIndexDrop(event, '{sample.id}', '{run_id}', 'i7')",
-                    ),
-                )
-            else:
-                index_i7 = Td(Span("-", cls="no-index"), cls="index-cell")
+            kit_name = '<span class="kit-name-empty">-</span>'
+        cells.append(f'<td class="kit-name-cell">{kit_name}</td>')
 
-        # i5 column - show assigned name+sequence or drop zone
+        # i7/i5 columns - show assigned name+sequence or drop zone
+        index_columns = [("i7", view.index1_sequence, view.index1_name, view.index1_well_position)]
         if show_i5_column:
-            if has_i5:
-                i5_name = sample.index2_name or ""
-                i5_well = sample.index2_well_position
-                i5_seq = sample.index2_sequence[:8] + ("..." if len(sample.index2_sequence) > 8 else "")
+            index_columns.append(("i5", view.index2_sequence, view.index2_name, view.index2_well_position))
+        for index_type, sequence, name, well in index_columns:
+            if sequence is not None:
                 # Only show clear button in wizard views (not in run view where show_bulk_actions=True)
-                clear_button_i5 = None
-                if not show_bulk_actions:
-                    clear_i5_url = f"/runs/{run_id}/samples/{sample.id}/clear-index?index_type=i5" + (f"&context={context}" if context else "")
-                    clear_button_i5 = Button(
-                        "x",
-                        hx_post=clear_i5_url,
-                        hx_target=f"#sample-row-{sample.id}",
-                        hx_swap="outerHTML",
-                        cls="btn-tiny btn-clear",
-                        title="Clear i5 index",
-                    )
-                index_i5 = Td(
-                    Div(
-                        Span(i5_name, cls="index-name-display") if i5_name else None,
-                        Span(i5_well, cls="index-well-display") if i5_well else None,
-                        Span(i5_seq, cls="assigned-index i5"),
-                        clear_button_i5,
-                        cls="index-assigned",
-                    ),
-                    cls="index-cell",
+                clear_button = "" if show_bulk_actions else _CLEAR_INDEX_TEMPLATE.format(
+                    sample_url=sample_url,
+                    row_target=row_target,
+                    index_type=index_type,
+                    ctx_amp=f"&amp;context={esc_context}" if context else "",
                 )
+                cells.append(_assigned_index_cell(name, well, sequence, index_type, clear_button))
+            elif editable:
+                cells.append(_INDEX_DROP_TEMPLATE.format(
+                    context=esc_context,
+                    uid=uid,
+                    run_id=esc_run_id,
+                    index_type=index_type,
+                ))
             else:
-                if editable:
-                    index_i5 = Td(
-                        Div(
-                            "Drop i5",
-                            cls="drop-zone i5-drop",
-                            data_context=context,
-                            ondragover="event.preventDefault(); this.classList.add('drag-over')",
-                            ondragleave="this.classList.remove('drag-over')",
-                            ondrop=f"handleIndexDrop(event, '{sample.id}', '{run_id}', 'i5')",
-                        ),
-                    )
-                else:
-                    index_i5 = Td(Span("-", cls="no-index"), cls="index-cell")
-        else:
-            index_i5 = None
-
-        # Index kit name cell
-        kit_name_cell = Td(
-            Span(sample.index_kit_name, cls="kit-name-display") if sample.index_kit_name else Span("-", cls="kit-name-empty"),
-            cls="kit-name-cell",
-        )
-
-        # Lanes display (read-only, set via bulk action)
-        lane_cell = Td(
-            Span(sample.lanes_display, cls="lanes-display"),
-            cls="lane-cell",
-        )
-
-        # Override cycles input (or read-only display)
-        if editable:
-            override_cell = Td(
-                Input(
-                    type="text",
-                    name="override_cycles",
-                    value=sample.override_cycles or "",
-                    placeholder="Auto",
-                    hx_post=f"/runs/{run_id}/samples/{sample.id}/settings",
-                    hx_target=f"#sample-row-{sample.id}",
-                    hx_swap="outerHTML",
-                    hx_trigger="change",
-                    cls="override-cycles-input",
-                ),
-                cls="override-cell",
-            )
-        else:
-            override_cell = Td(
-                Span(sample.override_cycles or "Auto", cls="override-cycles-display"),
-                cls="override-cell",
-            )
+                cells.append(_NO_INDEX_CELL)
 
-        # Barcode mismatches inputs (or read-only display)
-        if editable:
-            mismatch_i7_cell = Td(
-                Input(
-                    type="number",
-                    name="barcode_mismatches_index1",
-                    value=str(sample.barcode_mismatches_index1) if sample.barcode_mismatches_index1 is not None else "",
-                    placeholder="-",
-                    min="0",
-                    max="2",
-                    hx_post=f"/runs/{run_id}/samples/{sample.id}/settings",
-                    hx_target=f"#sample-row-{sample.id}",
-                    hx_swap="outerHTML",
-                    hx_trigger="change",
-                    cls="mismatch-input",
-                ),
-                cls="mismatch-cell",
-            )
-            mismatch_i5_cell = Td(
-                Input(
-                    type="number",
-                    name="barcode_mismatches_index2",
-                    value=str(sample.barcode_mismatches_index2) if sample.barcode_mismatches_index2 is not None else "",
-                    placeholder="-",
-                    min="0",
-                    max="2",
-                    hx_post=f"/runs/{run_id}/samples/{sample.id}/settings",
-                    hx_target=f"#sample-row-{sample.id}",
-                    hx_swap="outerHTML",
-                    hx_trigger="change",
-                    cls="mismatch-input",
-                ),
-                cls="mismatch-cell",
-            )
-        else:
-            mismatch_i7_cell = Td(
-                Span(str(sample.barcode_mismatches_index1) if sample.barcode_mismatches_index1 is not None else "-", cls="mismatch-display"),
-                cls="mismatch-cell",
-            )
-            mismatch_i5_cell = Td(
-                Span(str(sample.barcode_mismatches_index2) if sample.barcode_mismatches_index2 is not None else "-", cls="mismatch-display"),
-                cls="mismatch-cell",
-            )
-
-        cells = []
-        if effective_checkboxes:
-            cells.append(checkbox_cell)
-        cells.extend([
-            Td(sample.sample_id),
-            Td(sample.test_id),
-            Td(sample.worksheet_id or "-", cls="worksheet-cell"),
-            kit_name_cell,
-            index_i7,
-        ])
-        if show_i5_column:
-            cells.append(index_i5)
         # Only include lanes, override cycles, mismatches if bulk actions enabled
         if show_bulk_actions:
-            cells.extend([lane_cell, override_cell, mismatch_i7_cell, mismatch_i5_cell])
-
-        # Only show delete button if editable
-        if editable:
-            delete_url = f"/runs/{run_id}/samples/{sample.id}{ctx_param}"
+            # Lanes display (read-only, set via bulk action)
+            cells.append(f'<td class="lane-cell"><span class="lanes-display">{escape_html_attr(view.lanes_display)}</span></td>')
+            if editable:
+                cells.append(_OVERRIDE_INPUT_TEMPLATE.format(
+                    value=escape_html_attr(view.override_cycles), sample_url=sample_url, row_target=row_target,
+                ))
+                for name, value in (
+                    ("barcode_mismatches_index1", view.barcode_mismatches_index1),
+                    ("barcode_mismatches_index2", view.barcode_mismatches_index2),
+                ):
+                    cells.append(_MISMATCH_INPUT_TEMPLATE.format(
+                        name=name, value=_mismatch_display(value), sample_url=sample_url, row_target=row_target,
+                    ))
+            else:
+                cells.append(
+                    '<td class="override-cell"><span class="override-cycles-display">'
+                    f'{escape_html_attr(view.override_cycles) or "Auto"}</span></td>'
+                )
+                for value in (view.barcode_mismatches_index1, view.barcode_mismatches_index2):
+                    cells.append(
+                        '<td class="mismatch-cell"><span class="mismatch-display">'
+                        f'{_mismatch_display(value) or "-"}</span></td>'
+                    )
 
+    # Only show delete button if editable
+    if editable:
+        if not show_drop_zones:
+            delete_url = sample_url
+            delete_target = row_target
+        else:
+            delete_url = sample_url + (f"?context={esc_context}" if context else "")
             # For add_step2 context, delete should just remove the row (not refresh entire table)
             # because we don't have access to existing_sample_ids to filter properly
-            if context == "add_step2":
-                delete_target = f"#sample-row-{sample.id}"
-                delete_swap = "outerHTML"
-            else:
-                delete_target = "#sample-table"
-                delete_swap = "outerHTML"
-
-            cells.append(
-                Td(
-                    Button(
-                        "\u00d7",
-                        hx_delete=delete_url,
-                        hx_target=delete_target,
-                        hx_swap=delete_swap,
-                        hx_confirm="Delete this sample?",
-                        cls="btn-tiny btn-danger",
-                        title="Delete sample",
-                    ),
-                    cls="actions",
-                )
-            )
+            delete_target = row_target if context == "add_step2" else "#sample-table"
+        cells.append(_DELETE_CELL_TEMPLATE.format(url=delete_url, target=delete_target))
 
-        return Tr(
-            *cells,
-            cls=row_class,
-            id=f"sample-row-{sample.id}",
-        )
-    else:
-        # Simple row without drop zones
-        cells = []
-        if effective_checkboxes:
-            cells.append(checkbox_cell)
-        cells.extend([
-            Td(sample.sample_id),
-            Td(sample.test_id),
-            Td(sample.worksheet_id or "-", cls="worksheet-cell"),
-        ])
-        # Only show delete button if editable
-        if editable:
-            cells.append(
-                Td(
-                    Button(
-                        "\u00d7",
-                        hx_delete=f"/runs/{run_id}/samples/{sample.id}",
-                        hx_target=f"#sample-row-{sample.id}",
-                        hx_swap="outerHTML",
-                        hx_confirm="Delete this sample?",
-                        cls="btn-tiny btn-danger",
-                        title="Delete sample",
-                    ),
-                    cls="actions",
-                )
-            )
-        return Tr(
-            *cells,
-            cls=row_class,
-            id=f"sample-row-{sample.id}",
-        )
+    return _WIZARD_ROW_TEMPLATE.format(row_cls=row_class, uid=uid, cells="".join(cells))
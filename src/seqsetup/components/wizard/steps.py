@@ -1,12 +1,32 @@
 """Core wizard navigation and run configuration forms."""
 
+from functools import lru_cache
+
 from fasthtml.common import *
 
+from ...data.instruments import (
+    get_enabled_instruments,
+    get_flowcells_for_instrument,
+    get_index_cycle_options,
+    get_reagent_kits_for_flowcell,
+)
 from ...models.index import IndexKit
-from ...models.sequencing_run import SequencingRun
+from ...models.sequencing_run import RunCycles, SequencingRun
+from ...utils.html import escape_html_attr, options_html
 from ..export_panel import ValidationSummary
 from .sample_table import BulkPasteSectionWizard, SampleTableWizard
-from .index_panel import IndexKitDropdown, IndexKitPanel
+from .index_panel import IndexKitDropdown, IndexKitPanelLoader
+
+
+# New run wizard has a single step; only its state class and run ID vary
+_WIZARD_PROGRESS_TEMPLATE = (
+    '<div class="wizard-progress">'
+    '<a href="/runs/new/step/1?run_id={run_id}" class="{cls}">'
+    '<span class="step-number">1</span>'
+    '<span class="step-label">Run Configuration</span>'
+    '</a>'
+    '</div>'
+)
 
 
 def WizardProgress(current_step: int, run_id: str):
@@ -17,40 +37,37 @@ def WizardProgress(current_step: int, run_id: str):
         current_step: Current step number (1 for new run config)
         run_id: Run ID for navigation links
     """
-    steps = [
-        ("1", "Run Configuration", f"/runs/new/step/1?run_id={run_id}"),
-    ]
+    if current_step == 1:
+        cls = "wizard-step active"
+    elif current_step > 1:
+        cls = "wizard-step completed"
+    else:
+        cls = "wizard-step"
+
+    return NotStr(_WIZARD_PROGRESS_TEMPLATE.format(
+        run_id=escape_html_attr(run_id),
+        cls=cls,
+    ))
 
-    return Div(
-        *[
-            WizardStepIndicator(
-                number=num,
-                label=label,
-                href=href,
-                is_active=(int(num) == current_step),
-                is_completed=(int(num) < current_step),
-            )
-            for num, label, href in steps
-        ],
-        cls="wizard-progress",
-    )
+
+# Step indicator classes indexed by (is_completed << 1) | is_active
+_STEP_CLASSES = (
+    "wizard-step",
+    "wizard-step active",
+    "wizard-step completed",
+    "wizard-step active completed",
+)
 
 
 def WizardStepIndicator(
     number: str, label: str, href: str, is_active: bool, is_completed: bool
 ):
     """Individual step indicator in the wizard progress bar."""
-    classes = ["wizard-step"]
-    if is_active:
-        classes.append("active")
-    if is_completed:
-        classes.append("completed")
-
     return A(
         Span(number, cls="step-number"),
         Span(label, cls="step-label"),
         href=href,
-        cls=" ".join(classes),
+        cls=_STEP_CLASSES[(bool(is_completed) << 1) | bool(is_active)],
     )
 
 
@@ -83,11 +100,16 @@ def WizardNavigation(step: int, run_id: str, can_proceed: bool = True, oob: bool
     )
 
 
-def WizardStep1(run: SequencingRun):
+def WizardStep1(run: SequencingRun, instrument_config=None):
     """
     Wizard Step 1: Run Configuration.
 
     Configures instrument, flowcell, and cycle settings.
+
+    Args:
+        run: Run being configured
+        instrument_config: InstrumentConfig already loaded by the route
+            (loaded from the repository if None)
     """
     return Div(
         WizardProgress(1, run.id),
@@ -97,7 +119,7 @@ def WizardStep1(run: SequencingRun):
             RunMetadataDisplayWizard(run),
             Div(
                 RunNameFormWizard(run),
-                InstrumentConfigFormWizard(run),
+                InstrumentConfigFormWizard(run, instrument_config),
                 CycleConfigFormWizard(run),
                 cls="wizard-form",
             ),
@@ -163,12 +185,8 @@ def WizardStep2(run: SequencingRun, index_kits: list[IndexKit], sample_api_enabl
                 # Index kits panel on the left
                 Aside(
                     H3("Available Indexes"),
-                    IndexKitDropdown(index_kits, default_kit.name if default_kit else None),
-                    Div(
-                        IndexKitPanel(default_kit) if default_kit else P("No index kits available.", cls="no-kits-message"),
-                        cls="index-kits-compact",
-                        id="index-list-container",
-                    ),
+                    IndexKitDropdown(index_kits, default_kit.kit_id if default_kit else None),
+                    IndexKitPanelLoader(default_kit),
                     cls="wizard-index-panel",
                 ),
                 # Sample table on the right with drop zones
@@ -283,16 +301,21 @@ def RunNameFormWizard(run: SequencingRun):
     )
 
 
-def InstrumentConfigFormWizard(run: SequencingRun):
-    """Instrument config form for wizard - delegates to original with run_id."""
-    from ...data.instruments import (
-        get_enabled_instruments,
-        get_flowcells_for_instrument,
-        get_reagent_kits_for_flowcell,
-    )
-    from ...startup import get_instrument_config_repo
+def InstrumentConfigFormWizard(run: SequencingRun, instrument_config=None):
+    """
+    Instrument config form for wizard - delegates to original with run_id.
+
+    Args:
+        run: Run being configured
+        instrument_config: InstrumentConfig already loaded by the route
+            (loaded from the repository if None)
+    """
+    if instrument_config is None:
+        # Deferred: startup imports the repositories and app context
+        from ...startup import get_instrument_config_repo
+
+        instrument_config = get_instrument_config_repo().get()
 
-    instrument_config = get_instrument_config_repo().get()
     instruments = get_enabled_instruments(instrument_config)
     current_flowcells = get_flowcells_for_instrument(run.instrument_platform)
     current_reagent_kits = get_reagent_kits_for_flowcell(
@@ -304,14 +327,10 @@ def InstrumentConfigFormWizard(run: SequencingRun):
         Div(
             Label("Platform", fr="instrument_platform"),
             Select(
-                *[
-                    Option(
-                        inst["name"],
-                        value=inst["platform"].value,
-                        selected=run.instrument_platform == inst["platform"],
-                    )
+                NotStr(options_html(
+                    (inst["platform"].value, inst["name"], run.instrument_platform == inst["platform"])
                     for inst in instruments
-                ],
+                )),
                 name="instrument_platform",
                 id="instrument_platform",
                 hx_post=f"/runs/{run.id}/instrument",
@@ -337,14 +356,10 @@ def InstrumentConfigFormWizard(run: SequencingRun):
 def FlowcellSelectWizard(run_id: str, current: str, flowcells: dict):
     """Flowcell dropdown for wizard."""
     return Select(
-        *[
-            Option(
-                f"{fc} - {info['description']}",
-                value=fc,
-                selected=current == fc,
-            )
+        NotStr(options_html(
+            (fc, f"{fc} - {info['description']}", current == fc)
             for fc, info in flowcells.items()
-        ],
+        )),
         name="flowcell_type",
         id="flowcell-select",
         hx_post=f"/runs/{run_id}/flowcell",
@@ -356,14 +371,10 @@ def FlowcellSelectWizard(run_id: str, current: str, flowcells: dict):
 def ReagentKitSelectWizard(run_id: str, current: int, reagent_kits: list[int]):
     """Reagent kit dropdown for wizard."""
     return Select(
-        *[
-            Option(
-                f"{kit} cycles",
-                value=str(kit),
-                selected=current == kit,
-            )
+        NotStr(options_html(
+            (str(kit), f"{kit} cycles", current == kit)
             for kit in reagent_kits
-        ],
+        )),
         name="reagent_cycles",
         id="reagent-kit-select",
         hx_post=f"/runs/{run_id}/reagent-kit",
@@ -372,79 +383,57 @@ def ReagentKitSelectWizard(run_id: str, current: int, reagent_kits: list[int]):
     )
 
 
+# Keyed on the option list as well as the selection, so a reloaded
+# instrument config produces fresh entries
+@lru_cache(maxsize=64)
+def _index_cycle_options_html(selected: int, options: tuple[int, ...]) -> str:
+    """Rendered <option> list for an index cycles select."""
+    return options_html((str(v), str(v), selected == v) for v in options)
+
+
+# Cycle config form markup; only the run id, cycle values and option lists
+# vary. All substituted values must already be escaped.
+_CYCLE_CONFIG_FORM_TEMPLATE = (
+    '<fieldset hx-post="/runs/{run_id}/cycles" hx-target="#sample-table" hx-swap="outerHTML"'
+    ' class="cycle-config" id="cycle-config">'
+    '<legend>Run Cycle Configuration</legend>'
+    '<div class="cycle-row">'
+    '<div class="form-group">'
+    '<label for="read1_cycles">Read 1</label>'
+    '<input type="number" name="read1_cycles" id="read1_cycles" value="{read1}" min="1" max="{reagent_cycles}">'
+    '</div>'
+    '<div class="form-group">'
+    '<label for="read2_cycles">Read 2</label>'
+    '<input type="number" name="read2_cycles" id="read2_cycles" value="{read2}" min="0" max="{reagent_cycles}">'
+    '</div>'
+    '</div>'
+    '<div class="cycle-row">'
+    '<div class="form-group">'
+    '<label for="index1_cycles">Index 1</label>'
+    '<select name="index1_cycles" id="index1_cycles">{index1_options}</select>'
+    '</div>'
+    '<div class="form-group">'
+    '<label for="index2_cycles">Index 2</label>'
+    '<select name="index2_cycles" id="index2_cycles">{index2_options}</select>'
+    '</div>'
+    '</div>'
+    '<div class="cycle-total"><span>Total: {total} / {reagent_cycles} cycles</span></div>'
+    '<button type="submit" class="btn-primary btn-small">Apply Cycles</button>'
+    '</fieldset>'
+)
+
+
 def CycleConfigFormWizard(run: SequencingRun):
     """Cycle config form for wizard with run_id in path."""
-    from ...data.instruments import get_default_cycles, get_index_cycle_options
-    from ...models.sequencing_run import RunCycles
-
     cycles = run.run_cycles or RunCycles(150, 150, 10, 10)
-    defaults = get_default_cycles(run.reagent_cycles)
-    index_cycle_options = get_index_cycle_options()
-
-    return Fieldset(
-        Legend("Run Cycle Configuration"),
-        Div(
-            Div(
-                Label("Read 1", fr="read1_cycles"),
-                Input(
-                    type="number",
-                    name="read1_cycles",
-                    id="read1_cycles",
-                    value=str(cycles.read1_cycles),
-                    min="1",
-                    max=str(run.reagent_cycles),
-                ),
-                cls="form-group",
-            ),
-            Div(
-                Label("Read 2", fr="read2_cycles"),
-                Input(
-                    type="number",
-                    name="read2_cycles",
-                    id="read2_cycles",
-                    value=str(cycles.read2_cycles),
-                    min="0",
-                    max=str(run.reagent_cycles),
-                ),
-                cls="form-group",
-            ),
-            cls="cycle-row",
-        ),
-        Div(
-            Div(
-                Label("Index 1", fr="index1_cycles"),
-                Select(
-                    *[
-                        Option(str(v), value=str(v), selected=cycles.index1_cycles == v)
-                        for v in index_cycle_options
-                    ],
-                    name="index1_cycles",
-                    id="index1_cycles",
-                ),
-                cls="form-group",
-            ),
-            Div(
-                Label("Index 2", fr="index2_cycles"),
-                Select(
-                    *[
-                        Option(str(v), value=str(v), selected=cycles.index2_cycles == v)
-                        for v in index_cycle_options
-                    ],
-                    name="index2_cycles",
-                    id="index2_cycles",
-                ),
-                cls="form-group",
-            ),
-            cls="cycle-row",
-        ),
-        Div(
-            Span(f"Total: {cycles.total_cycles} / {run.reagent_cycles} cycles"),
-            cls="cycle-total",
-        ),
-        Button("Apply Cycles", type="submit", cls="btn-primary btn-small"),
-        hx_post=f"/runs/{run.id}/cycles",
-        hx_target="#sample-table",
-        hx_swap="outerHTML",
-        cls="cycle-config",
-        id="cycle-config",
-    )
+    index_cycle_options = tuple(get_index_cycle_options())
+
+    return NotStr(_CYCLE_CONFIG_FORM_TEMPLATE.format(
+        run_id=escape_html_attr(run.id),
+        read1=cycles.read1_cycles,
+        read2=cycles.read2_cycles,
+        reagent_cycles=run.reagent_cycles,
+        index1_options=_index_cycle_options_html(cycles.index1_cycles, index_cycle_options),
+        index2_options=_index_cycle_options_html(cycles.index2_cycles, index_cycle_options),
+        total=cycles.total_cycles,
+    ))
@@ -14,6 +14,13 @@ from typing import Optional, TYPE_CHECKING
 
 import yaml
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when
+# PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 if TYPE_CHECKING:
     from ..repositories.instrument_definition_repo import InstrumentDefinitionRepository
 
@@ -116,7 +123,7 @@ def _load_config() -> dict:
     """Load instrument configuration from YAML file."""
     config_path = _find_config_path()
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 # Load configuration at module import time
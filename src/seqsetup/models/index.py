@@ -23,7 +23,7 @@ class IndexMode(Enum):
     SINGLE = "single"  # i7 only
 
 
-@dataclass
+@dataclass(slots=True)
 class Index:
     """Single index sequence (i7 or i5)."""
 
@@ -68,7 +68,7 @@ class Index:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexPair:
     """A pair of indexes (dual indexing) that can be assigned to a sample."""
 
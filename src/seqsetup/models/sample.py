@@ -7,7 +7,7 @@ import uuid
 from .index import Index, IndexPair
 
 
-@dataclass
+@dataclass(slots=True)
 class Sample:
     """A sequencing sample with assigned indexes."""
 
@@ -272,10 +272,11 @@ class ValidationResult:
 
     duplicate_sample_ids: list[str]  # Error messages
     index_collisions: list[IndexCollision]
-    distance_matrices: dict[int, IndexDistanceMatrix]  # Lane -> matrix
+    # Display-only sections below are None when skipped via validate_run(sections=...)
+    distance_matrices: Optional[dict[int, IndexDistanceMatrix]]  # Lane -> matrix (lanes with 2+ indexed samples)
     dark_cycle_errors: list[DarkCycleError] = field(default_factory=list)
-    dark_cycle_samples: list[SampleDarkCycleInfo] = field(default_factory=list)  # Per-sample dark cycle info
-    color_balance: dict[int, LaneColorBalance] = field(default_factory=dict)  # Lane -> balance
+    dark_cycle_samples: Optional[list[SampleDarkCycleInfo]] = field(default_factory=list)  # Per-sample dark cycle info
+    color_balance: Optional[dict[int, LaneColorBalance]] = field(default_factory=dict)  # Lane -> balance
     application_errors: list[ApplicationValidationError] = field(default_factory=list)
     configuration_errors: list[ConfigurationError] = field(default_factory=list)
     chemistry_type: Optional[str] = None  # "2-color" or "4-color"
@@ -310,14 +311,16 @@ class ValidationResult:
         return sum(1 for e in self.configuration_errors if e.severity == ValidationSeverity.WARNING)
 
     @property
-    def color_balance_issue_count(self) -> int:
-        """Count lanes with color balance issues."""
+    def color_balance_issue_count(self) -> Optional[int]:
+        """Count lanes with color balance issues (None if not computed)."""
+        if self.color_balance is None:
+            return None
         return sum(1 for lb in self.color_balance.values() if lb.has_issues)
 
     def get_lane_matrix(self, lane: int) -> Optional[IndexDistanceMatrix]:
         """Get distance matrix for a specific lane."""
-        return self.distance_matrices.get(lane)
+        return (self.distance_matrices or {}).get(lane)
 
     def get_lane_color_balance(self, lane: int) -> Optional[LaneColorBalance]:
         """Get color balance for a specific lane."""
-        return self.color_balance.get(lane)
+        return (self.color_balance or {}).get(lane)
@@ -3,7 +3,13 @@
 from fasthtml.common import *
 from starlette.responses import Response
 
-from .utils import require_admin, sanitize_string
+from .utils import (
+    PRIVATE_REVALIDATE,
+    check_not_modified,
+    compute_etag,
+    require_admin,
+    sanitize_string,
+)
 from ..components.layout import AppShell
 from ..components.api_tokens import ApiTokensPage
 from ..context import AppContext
@@ -23,11 +29,25 @@ def register(app, rt, ctx: AppContext):
         user = req.scope.get("auth")
         tokens = ctx.api_token_repo.list_all()
 
-        return AppShell(
-            user=user,
-            active_route="/admin/api-tokens",
-            content=ApiTokensPage(tokens),
-            title="API Tokens",
+        etag = compute_etag(
+            user.username,
+            user.display_name,
+            user.role,
+            req.headers.get("hx-request"),
+            [(t.id, t.name, t.created_by, t.created_at) for t in tokens],
+        )
+        if not_modified := check_not_modified(req, etag):
+            return not_modified
+
+        return (
+            *AppShell(
+                user=user,
+                active_route="/admin/api-tokens",
+                content=ApiTokensPage(tokens),
+                title="API Tokens",
+            ),
+            HttpHeader("ETag", etag),
+            HttpHeader("Cache-Control", PRIVATE_REVALIDATE),
         )
 
     @app.post("/admin/api-tokens/create")
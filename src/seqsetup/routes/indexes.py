@@ -25,7 +25,7 @@ from ..models.index import IndexMode
 from ..services.index_parser import IndexParser
 from ..services.index_validator import IndexValidator
 from ..services.index_kit_yaml_exporter import IndexKitYamlExporter
-from .utils import require_admin
+from .utils import PRIVATE_REVALIDATE, check_not_modified, compute_etag, require_admin
 
 
 def _parse_index_override(pattern: str) -> Optional[int]:
@@ -242,7 +242,18 @@ def register(app, rt, ctx: AppContext):
         if not kit:
             return P(f"Index kit '{selected_kit}' not found", cls="error-message")
 
-        return IndexKitPanel(kit)
+        # The panel is a function of the stored kit alone. Kits have no
+        # revision counter, so the ETag covers the full document; a
+        # re-uploaded or re-synced kit always gets a new one.
+        etag = compute_etag(req.headers.get("hx-request"), kit.to_dict())
+        if not_modified := check_not_modified(req, etag):
+            return not_modified
+
+        return (
+            IndexKitPanel(kit),
+            HttpHeader("ETag", etag),
+            HttpHeader("Cache-Control", PRIVATE_REVALIDATE),
+        )
 
     @app.get("/indexes/download/{name}/{version}")
     def download_index_kit(req, name: str, version: str):
@@ -3,7 +3,13 @@
 from fasthtml.common import *
 from starlette.responses import Response
 
-from .utils import require_admin, sanitize_string
+from .utils import (
+    PRIVATE_REVALIDATE,
+    check_not_modified,
+    compute_etag,
+    require_admin,
+    sanitize_string,
+)
 from ..components.layout import AppShell
 from ..components.local_users import EditUserRow, LocalUsersPage, UserTable
 from ..context import AppContext
@@ -24,11 +30,28 @@ def register(app, rt, ctx: AppContext):
         user = req.scope.get("auth")
         users = ctx.local_user_repo.list_all()
 
-        return AppShell(
-            user=user,
-            active_route="/admin/users",
-            content=LocalUsersPage(users),
-            title="Local Users",
+        etag = compute_etag(
+            user.username,
+            user.display_name,
+            user.role,
+            req.headers.get("hx-request"),
+            [
+                (u.username, u.display_name, u.email, u.role, u.created_at)
+                for u in users
+            ],
+        )
+        if not_modified := check_not_modified(req, etag):
+            return not_modified
+
+        return (
+            *AppShell(
+                user=user,
+                active_route="/admin/users",
+                content=LocalUsersPage(users),
+                title="Local Users",
+            ),
+            HttpHeader("ETag", etag),
+            HttpHeader("Cache-Control", PRIVATE_REVALIDATE),
         )
 
     @app.post("/admin/users/create")
@@ -550,9 +550,9 @@ def register(app, rt, ctx: AppContext):
         lanes_json = form.get("lanes", "[]")
 
         try:
-            sample_ids = json.loads(sample_ids_json)
+            sample_ids = set(json.loads(sample_ids_json))
             lanes = json.loads(lanes_json)
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, TypeError):
             return Response("Invalid request data", status_code=400)
 
         # Update lanes for each selected sample
@@ -589,8 +589,8 @@ def register(app, rt, ctx: AppContext):
         mismatch_index2_str = form.get("mismatch_index2", "")
 
         try:
-            sample_ids = json.loads(sample_ids_json)
-        except json.JSONDecodeError:
+            sample_ids = set(json.loads(sample_ids_json))
+        except (json.JSONDecodeError, TypeError):
             return Response("Invalid request data", status_code=400)
 
         # Parse mismatch values (empty string means clear/None)
@@ -641,8 +641,8 @@ def register(app, rt, ctx: AppContext):
         override_cycles_str = form.get("override_cycles", "")
 
         try:
-            sample_ids = json.loads(sample_ids_json)
-        except json.JSONDecodeError:
+            sample_ids = set(json.loads(sample_ids_json))
+        except (json.JSONDecodeError, TypeError):
             return Response("Invalid request data", status_code=400)
 
         # Update override cycles for each selected sample
@@ -689,8 +689,8 @@ def register(app, rt, ctx: AppContext):
         test_id_str = form.get("test_id", "")
 
         try:
-            sample_ids = json.loads(sample_ids_json)
-        except json.JSONDecodeError:
+            sample_ids = set(json.loads(sample_ids_json))
+        except (json.JSONDecodeError, TypeError):
             return Response("Invalid request data", status_code=400)
 
         # Update test_id for each selected sample
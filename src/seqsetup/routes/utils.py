@@ -1,5 +1,6 @@
 """Shared utilities for route handlers."""
 
+import hashlib
 import re
 
 from starlette.responses import Response
@@ -98,3 +99,37 @@ def sanitize_string(value: str, max_len: int = 256) -> str:
         Stripped and length-limited string
     """
     return value.strip()[:max_len] if value else ""
+
+
+# Cache-Control for authenticated pages that may be cached by the browser but
+# must be revalidated (via ETag) on every request.
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def compute_etag(*parts) -> str:
+    """Compute a weak ETag from the values that determine a rendered page.
+
+    Callers must pass every value that affects the output, including the
+    viewing user and whether the request is an HTMX partial.
+    """
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def check_not_modified(req, etag: str) -> Response | None:
+    """Check the request's If-None-Match header against an ETag.
+
+    Returns a 304 Response if the client's cached copy is current, None if
+    the page must be rendered.
+    """
+    if_none_match = req.headers.get("if-none-match", "")
+    if not if_none_match:
+        return None
+    # Weak comparison: ignore the W/ prefix on both sides
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE},
+        )
+    return None
@@ -1,5 +1,7 @@
 """Validation routes for index collision checking."""
 
+import time
+
 from fasthtml.common import *
 from starlette.responses import Response
 
@@ -13,21 +15,58 @@ from ..components.validation import (
 from ..context import AppContext
 from ..services.validation import ValidationService
 from ..models.sequencing_run import RunStatus
-from .utils import get_username
+from .utils import PRIVATE_REVALIDATE, check_not_modified, compute_etag, get_username
+
+# Validation results are reused across read-only requests for the same run
+# (page load followed by tab switches) for a short time. Entries are keyed on
+# run ID and only reused while run.updated_at is unchanged. Test/application
+# profiles and instrument config can change independently of the run, so
+# entries expire quickly, and approval always validates afresh.
+RESULT_CACHE_TTL_SECONDS = 60
+RESULT_CACHE_MAX_ENTRIES = 128
 
 
 def register(app, rt, ctx: AppContext):
     """Register validation routes."""
 
-    def _validate_run(run):
+    # run_id -> (monotonic time computed, run.updated_at, result)
+    result_cache: dict[str, tuple] = {}
+
+    def _validate_run(run, sections=None):
         """Run validation with profile repos if available."""
         return ValidationService.validate_run(
             run,
             test_profile_repo=ctx.test_profile_repo,
             app_profile_repo=ctx.app_profile_repo,
             instrument_config=ctx.instrument_config,
+            sections=sections,
         )
 
+    def _cached_validation(run):
+        """Validation result for display, reused from a recent identical request.
+
+        Returns (computed_at, result); computed_at identifies the result for
+        ETag purposes.
+        """
+        now = time.monotonic()
+        entry = result_cache.get(run.id)
+        if entry and now - entry[0] < RESULT_CACHE_TTL_SECONDS and entry[1] == run.updated_at:
+            return entry[0], entry[2]
+
+        result = _validate_run(run)
+        if len(result_cache) >= RESULT_CACHE_MAX_ENTRIES:
+            for run_id, (computed_at, _, _) in list(result_cache.items()):
+                if now - computed_at >= RESULT_CACHE_TTL_SECONDS:
+                    result_cache.pop(run_id, None)
+            if len(result_cache) >= RESULT_CACHE_MAX_ENTRIES:
+                result_cache.clear()
+        result_cache[run.id] = (now, run.updated_at, result)
+        return now, result
+
+    def _cached_validate_run(run):
+        """Validation result for display (see _cached_validation)."""
+        return _cached_validation(run)[1]
+
     @rt("/runs/{run_id}/validation")
     def validation_page(req, run_id: str):
         """Display the full validation page for a run."""
@@ -37,19 +76,33 @@ def register(app, rt, ctx: AppContext):
             return Response("Run not found", status_code=404)
 
         user = req.scope.get("auth")
-        result = _validate_run(run)
+        result = _cached_validate_run(run)
         return ValidationPage(run, user, result=result)
 
     @rt("/runs/{run_id}/validation/tab/{tab}")
-    def get_validation_tab(run_id: str, tab: str, type: str = "i7"):
+    def get_validation_tab(req, run_id: str, tab: str, type: str = "i7"):
         """Get validation tab content (issues, heatmaps, colorbalance, darkcycles)."""
         run = ctx.run_repo.get_by_id(run_id)
         if not run:
             return Div(P("Run not found"), cls="error")
 
-        result = _validate_run(run)
+        computed_at, result = _cached_validation(run)
         kwargs = {"index_type": type} if tab == "heatmaps" else {}
-        return ValidationTabs(run_id, result, active_tab=tab, **kwargs)
+
+        # The tab markup is a function of the validation result, tab and
+        # index type; a recomputed result always gets a new ETag. HTMX and
+        # plain GETs of this URL get a fragment and a full page respectively.
+        etag = compute_etag(
+            req.headers.get("hx-request"), run.id, run.updated_at, computed_at, tab, kwargs
+        )
+        if not_modified := check_not_modified(req, etag):
+            return not_modified
+
+        return (
+            ValidationTabs(run_id, result, active_tab=tab, **kwargs),
+            HttpHeader("ETag", etag),
+            HttpHeader("Cache-Control", PRIVATE_REVALIDATE),
+        )
 
     @rt("/runs/{run_id}/validation/errors")
     def get_validation_errors(run_id: str):
@@ -59,7 +112,7 @@ def register(app, rt, ctx: AppContext):
         if not run:
             return Div(P("Run not found"), cls="error")
 
-        result = _validate_run(run)
+        result = _cached_validate_run(run)
         return ValidationErrorList(result)
 
     @rt("/runs/{run_id}/validation/heatmap")
@@ -72,7 +125,7 @@ def register(app, rt, ctx: AppContext):
         if not run:
             return Div(P("Run not found"), cls="error")
 
-        result = _validate_run(run)
+        result = _cached_validate_run(run)
         matrix = result.distance_matrices.get(lane)
         if matrix and len(matrix.sample_names) >= 2:
             return LaneHeatmapContent(run_id, lane, matrix, index_type=type)
@@ -89,12 +142,13 @@ def register(app, rt, ctx: AppContext):
         if run.status != RunStatus.DRAFT:
             return Response("Validation can only be approved on draft runs", status_code=400)
 
-        result = _validate_run(run)
+        # The approval bar only needs error counts
+        result = _validate_run(run, sections=())
 
         # Only allow approval if there are no errors
         can_approve = (
-            result.error_count == 0
-            and run.has_samples
+            run.has_samples
+            and result.error_count == 0
             and run.all_samples_have_indexes
         )
         if can_approve:
@@ -119,5 +173,5 @@ def register(app, rt, ctx: AppContext):
         run.touch(reset_validation=False, updated_by=get_username(req))
         ctx.run_repo.save(run)
 
-        result = _validate_run(run)
+        result = _validate_run(run, sections=())
         return ValidationApprovalBar(run, result)
@@ -45,7 +45,7 @@ def register(app, rt, ctx: AppContext):
         return AppShell(
             user=user,
             active_route=None,
-            content=WizardStep1(run),
+            content=WizardStep1(run, ctx.instrument_config),
             title="New Run - Configuration",
         )
 
@@ -61,7 +61,7 @@ class ColorAnalysisValidator:
             # Check i7 (index1)
             i7_seq = sample.index1_sequence
             if i7_seq and len(i7_seq) >= 2:
-                if i7_seq[0].upper() == dark_base and i7_seq[1].upper() == dark_base:
+                if cls._count_leading_dark(i7_seq, dark_base) == 2:
                     errors.append(
                         DarkCycleError(
                             sample_id=sample.id,
@@ -80,10 +80,7 @@ class ColorAnalysisValidator:
                     if i5_orientation == "reverse-complement"
                     else i5_seq
                 )
-                if (
-                    read_seq[0].upper() == dark_base
-                    and read_seq[1].upper() == dark_base
-                ):
+                if cls._count_leading_dark(read_seq, dark_base) == 2:
                     errors.append(
                         DarkCycleError(
                             sample_id=sample.id,
@@ -133,19 +130,8 @@ class ColorAnalysisValidator:
                 i5_read = i5_seq
 
             # Count leading dark bases
-            i7_leading = 0
-            for base in i7_seq[:2]:
-                if base.upper() == dark_base:
-                    i7_leading += 1
-                else:
-                    break
-
-            i5_leading = 0
-            for base in i5_read[:2]:
-                if base.upper() == dark_base:
-                    i5_leading += 1
-                else:
-                    break
+            i7_leading = cls._count_leading_dark(i7_seq, dark_base)
+            i5_leading = cls._count_leading_dark(i5_read, dark_base)
 
             results.append(
                 SampleDarkCycleInfo(
@@ -162,6 +148,17 @@ class ColorAnalysisValidator:
 
         return results
 
+    @staticmethod
+    def _count_leading_dark(sequence: str, dark_base: str) -> int:
+        """
+        Count consecutive dark bases at the start of a sequence (0, 1 or 2).
+
+        Only the first two positions matter for dark cycle detection.
+        dark_base must be a single upper-case base.
+        """
+        prefix = sequence[:2].upper()
+        return len(prefix) - len(prefix.lstrip(dark_base))
+
     @classmethod
     def calculate_color_balance(
         cls,
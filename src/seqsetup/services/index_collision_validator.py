@@ -80,7 +80,8 @@ class IndexCollisionValidator:
             instrument_config: Optional InstrumentConfig for DB overrides
 
         Returns:
-            Dict mapping lane number to IndexDistanceMatrix for samples in that lane
+            Dict mapping lane number to IndexDistanceMatrix for samples in that
+            lane. Lanes with fewer than two indexed samples are omitted.
         """
         # Determine total lanes from flowcell
         total_lanes = get_lanes_for_flowcell(
@@ -239,56 +240,22 @@ class IndexCollisionValidator:
         Returns:
             IndexDistanceMatrix with distances between sample pairs
         """
-        n = len(samples)
-
         sample_ids = [s.id for s in samples]
         sample_names = [s.sample_id or s.sample_name or s.id for s in samples]
 
-        # Initialize matrices with None (diagonal will stay None)
-        i7_distances: list[list[Optional[int]]] = [
-            [None for _ in range(n)] for _ in range(n)
-        ]
-        i5_distances: list[list[Optional[int]]] = [
-            [None for _ in range(n)] for _ in range(n)
-        ]
+        # Read each sequence once; the properties are re-evaluated per access
+        i7_distances = cls._pairwise_distances([s.index1_sequence for s in samples])
+        i5_distances = cls._pairwise_distances([s.index2_sequence for s in samples])
+
+        # Combined distance is i7 + i5, or whichever of the two exists
         combined_distances: list[list[Optional[int]]] = [
-            [None for _ in range(n)] for _ in range(n)
+            [
+                d7 if d5 is None else d5 if d7 is None else d7 + d5
+                for d7, d5 in zip(row7, row5)
+            ]
+            for row7, row5 in zip(i7_distances, i5_distances)
         ]
 
-        for i in range(n):
-            for j in range(i + 1, n):
-                sample1 = samples[i]
-                sample2 = samples[j]
-
-                # Calculate i7 distance
-                i7_dist = None
-                if sample1.index1_sequence and sample2.index1_sequence:
-                    i7_dist = hamming_distance(
-                        sample1.index1_sequence, sample2.index1_sequence
-                    )
-                i7_distances[i][j] = i7_dist
-                i7_distances[j][i] = i7_dist  # Symmetric
-
-                # Calculate i5 distance
-                i5_dist = None
-                if sample1.index2_sequence and sample2.index2_sequence:
-                    i5_dist = hamming_distance(
-                        sample1.index2_sequence, sample2.index2_sequence
-                    )
-                i5_distances[i][j] = i5_dist
-                i5_distances[j][i] = i5_dist  # Symmetric
-
-                # Calculate combined distance (sum of i7 + i5)
-                combined_dist = None
-                if i7_dist is not None and i5_dist is not None:
-                    combined_dist = i7_dist + i5_dist
-                elif i7_dist is not None:
-                    combined_dist = i7_dist
-                elif i5_dist is not None:
-                    combined_dist = i5_dist
-                combined_distances[i][j] = combined_dist
-                combined_distances[j][i] = combined_dist  # Symmetric
-
         return IndexDistanceMatrix(
             sample_ids=sample_ids,
             sample_names=sample_names,
@@ -296,3 +263,23 @@ class IndexCollisionValidator:
             i5_distances=i5_distances,
             combined_distances=combined_distances,
         )
+
+    @staticmethod
+    def _pairwise_distances(sequences: list[Optional[str]]) -> list[list[Optional[int]]]:
+        """
+        Symmetric all-vs-all Hamming distance matrix.
+
+        Entries are None on the diagonal and for pairs where either
+        sequence is missing.
+        """
+        n = len(sequences)
+        distances: list[list[Optional[int]]] = [[None] * n for _ in range(n)]
+        for i, seq1 in enumerate(sequences):
+            if not seq1:
+                continue
+            row = distances[i]
+            for j in range(i + 1, n):
+                seq2 = sequences[j]
+                if seq2:
+                    row[j] = distances[j][i] = hamming_distance(seq1, seq2)
+        return distances
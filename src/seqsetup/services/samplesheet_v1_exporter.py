@@ -20,12 +20,14 @@ def _reverse_complement(seq: str) -> str:
 class SampleSheetV1Exporter:
     """Generate Illumina SampleSheet v1 (IEM) format for MiSeq and NovaSeq 6000."""
 
-    SUPPORTED_PLATFORMS = {InstrumentPlatform.MISEQ, InstrumentPlatform.NOVASEQ_6000}
+    SUPPORTED_PLATFORMS: frozenset[InstrumentPlatform] = frozenset(
+        {InstrumentPlatform.MISEQ, InstrumentPlatform.NOVASEQ_6000}
+    )
 
-    @classmethod
-    def supports(cls, platform: InstrumentPlatform) -> bool:
+    @staticmethod
+    def supports(platform: InstrumentPlatform) -> bool:
         """Check if instrument supports v1 export."""
-        return platform in cls.SUPPORTED_PLATFORMS
+        return platform in SampleSheetV1Exporter.SUPPORTED_PLATFORMS
 
     @classmethod
     def export(cls, run: SequencingRun) -> str:
@@ -12,6 +12,8 @@ specialized validator modules:
 import logging
 import re
 from collections import defaultdict
+from collections.abc import Collection
+from typing import Optional
 
 from ..data.instruments import (
     get_channel_config,
@@ -34,6 +36,13 @@ from .validation_utils import hamming_distance
 
 logger = logging.getLogger(__name__)
 
+# Optional result sections for ValidationService.validate_run(sections=...).
+# Everything that contributes to error/warning counts is always computed.
+SECTION_MATRICES = "matrices"  # Per-lane index distance matrices (heatmaps)
+SECTION_COLOR_BALANCE = "color_balance"  # Per-lane color balance tables
+SECTION_DARK_CYCLES = "dark_cycles"  # Per-sample dark cycle table
+ALL_SECTIONS = frozenset({SECTION_MATRICES, SECTION_COLOR_BALANCE, SECTION_DARK_CYCLES})
+
 
 class ValidationService:
     """Service for validating sequencing run configuration.
@@ -49,6 +58,7 @@ class ValidationService:
         test_profile_repo=None,
         app_profile_repo=None,
         instrument_config=None,
+        sections: Optional[Collection[str]] = None,
     ) -> ValidationResult:
         """
         Perform complete validation of a sequencing run.
@@ -58,20 +68,28 @@ class ValidationService:
             test_profile_repo: Optional TestProfileRepository for profile validation
             app_profile_repo: Optional ApplicationProfileRepository for profile validation
             instrument_config: Optional InstrumentConfig for DB overrides
+            sections: Display-only sections to compute (see ALL_SECTIONS).
+                None computes everything. Skipped sections are None on the
+                result; errors and warnings are always complete.
 
         Returns:
             ValidationResult with all errors and per-lane distance matrices
         """
+        if sections is None:
+            sections = ALL_SECTIONS
+
         # Sample ID validation
         duplicate_errors = cls.validate_sample_ids(run)
 
         # Index collision validation (delegated)
         collisions = IndexCollisionValidator.validate_index_collisions(run, instrument_config)
 
-        distance_matrices = (
-            IndexCollisionValidator.calculate_index_distances(run, instrument_config)
-            if run.samples else {}
-        )
+        distance_matrices = None
+        if SECTION_MATRICES in sections:
+            distance_matrices = (
+                IndexCollisionValidator.calculate_index_distances(run, instrument_config)
+                if run.samples else {}
+            )
 
         # Check if color balance analysis is enabled for this instrument
         color_balance_enabled = is_color_balance_enabled(run.instrument_platform)
@@ -83,20 +101,21 @@ class ValidationService:
         i5_orientation = get_i5_read_orientation(run.instrument_platform)
 
         # Color balance and dark cycle analysis (delegated)
+        color_balance = {} if SECTION_COLOR_BALANCE in sections else None
+        dark_cycle_samples = [] if SECTION_DARK_CYCLES in sections else None
+        dark_cycle_errors = []
         if color_balance_enabled and run.samples:
-            color_balance = ColorAnalysisValidator.calculate_color_balance(
-                run, channel_config, i5_orientation, instrument_config,
-            )
+            if color_balance is not None:
+                color_balance = ColorAnalysisValidator.calculate_color_balance(
+                    run, channel_config, i5_orientation, instrument_config,
+                )
             dark_cycle_errors = ColorAnalysisValidator.validate_dark_cycles(
                 run, channel_config, i5_orientation,
             )
-            dark_cycle_samples = ColorAnalysisValidator.build_dark_cycle_info(
-                run, channel_config, i5_orientation,
-            )
-        else:
-            color_balance = {}
-            dark_cycle_errors = []
-            dark_cycle_samples = []
+            if dark_cycle_samples is not None:
+                dark_cycle_samples = ColorAnalysisValidator.build_dark_cycle_info(
+                    run, channel_config, i5_orientation,
+                )
 
         # Application profile validation (delegated)
         application_errors = []
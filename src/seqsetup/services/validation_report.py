@@ -249,8 +249,7 @@ class ValidationReportPDF:
         if result.distance_matrices:
             elements.append(PageBreak())
             elements.append(Paragraph("Index Distance Heatmaps", heading_style))
-            for lane in sorted(result.distance_matrices.keys()):
-                matrix = result.distance_matrices[lane]
+            for lane, matrix in sorted(result.distance_matrices.items()):
                 if len(matrix.sample_names) < 2:
                     continue
                 elements.append(Paragraph(f"Lane {lane} ({len(matrix.sample_names)} samples)", subheading_style))
@@ -263,8 +262,7 @@ class ValidationReportPDF:
         if result.color_balance:
             elements.append(PageBreak())
             elements.append(Paragraph("Color Balance", heading_style))
-            for lane in sorted(result.color_balance.keys()):
-                cb = result.color_balance[lane]
+            for lane, cb in sorted(result.color_balance.items()):
                 if not cb.has_issues and not (cb.i7_balance or cb.i5_balance):
                     continue
                 elements.append(Paragraph(f"Lane {lane} ({cb.sample_count} samples)", subheading_style))
@@ -1,6 +1,7 @@
 """Shared utilities for validation services."""
 
 from collections import defaultdict
+from operator import ne
 from typing import Optional
 
 from ..data.instruments import get_lanes_for_flowcell
@@ -54,8 +55,8 @@ def hamming_distance(seq1: str, seq2: str) -> int:
     Returns:
         Number of positions where characters differ (up to shorter length)
     """
-    min_len = min(len(seq1), len(seq2))
-    return sum(c1 != c2 for c1, c2 in zip(seq1[:min_len], seq2[:min_len]))
+    # map() stops at the end of the shorter sequence
+    return sum(map(ne, seq1, seq2))
 
 
 _COMPLEMENT = str.maketrans("ACGTacgt", "TGCAtgca")
@@ -106,8 +106,11 @@ function handleDragStart(event, indexId, indexType) {
 function handleIndexDrop(event, sampleId, runId, dropZoneType) {
     event.preventDefault();
 
-    // Find the drop zone element reliably (event.target may be a child node)
-    const dropZone = event.currentTarget || event.target.closest('.drop-zone') || event.target;
+    // Find the drop zone element reliably (event.target may be a child node).
+    // For delegated listeners currentTarget is the document, not the zone.
+    const dropZone = (event.currentTarget && event.currentTarget.classList)
+        ? event.currentTarget
+        : (event.target.closest('.drop-zone') || event.target);
     dropZone.classList.remove('drag-over');
 
     // Get context from drop zone data attribute (for simplified wizard views)
@@ -201,6 +204,35 @@ function handleIndexDrop(event, sampleId, runId, dropZoneType) {
     clearIndexSelection();
 }
 
+// Delegated drag-and-drop for drop zones that carry their target in data
+// attributes (data-drop-sample-id, data-drop-run-id, data-drop-type) instead
+// of per-element ondragover/ondragleave/ondrop handlers.
+function findDelegatedDropZone(event) {
+    return event.target.closest ? event.target.closest('.drop-zone[data-drop-sample-id]') : null;
+}
+
+document.addEventListener('dragover', function(event) {
+    const zone = findDelegatedDropZone(event);
+    if (zone) {
+        event.preventDefault();
+        zone.classList.add('drag-over');
+    }
+});
+
+document.addEventListener('dragleave', function(event) {
+    const zone = findDelegatedDropZone(event);
+    if (zone) {
+        zone.classList.remove('drag-over');
+    }
+});
+
+document.addEventListener('drop', function(event) {
+    const zone = findDelegatedDropZone(event);
+    if (zone) {
+        handleIndexDrop(event, zone.dataset.dropSampleId, zone.dataset.dropRunId, zone.dataset.dropType);
+    }
+});
+
 // Clear selection when clicking outside indexes
 document.addEventListener('click', function(event) {
     if (!event.target.closest('.draggable-index') && !event.target.closest('.draggable-index-compact') && !event.target.closest('.selection-controls')) {
@@ -274,6 +306,17 @@ function handleSampleCheckboxClick(event) {
     updateSampleSelection();
 }
 
+// Post a bulk action for the selected samples and swap in the refreshed table.
+// The endpoint base URL comes from the bulk action panel.
+function submitBulkAction(action, values) {
+    const panel = document.getElementById('bulk-action-panel');
+    htmx.ajax('POST', `${panel.dataset.bulkUrl}/${action}`, {
+        target: '#sample-table',
+        swap: 'outerHTML',
+        values: values
+    });
+}
+
 function applyBulkLanesForm() {
     const selectedSampleIds = getSelectedSampleIds();
     if (selectedSampleIds.length === 0) {
@@ -284,12 +327,10 @@ function applyBulkLanesForm() {
     const laneCheckboxes = document.querySelectorAll('.bulk-lane-checkbox:checked');
     const lanes = Array.from(laneCheckboxes).map(cb => parseInt(cb.value));
 
-    // Populate hidden form fields
-    document.getElementById('bulk-sample-ids').value = JSON.stringify(selectedSampleIds);
-    document.getElementById('bulk-lanes').value = JSON.stringify(lanes);
-
-    // Trigger HTMX form submission
-    htmx.trigger('#bulk-lanes-form', 'submit');
+    submitBulkAction('set-lanes', {
+        sample_ids: JSON.stringify(selectedSampleIds),
+        lanes: JSON.stringify(lanes),
+    });
 }
 
 function clearBulkLanesForm() {
@@ -299,12 +340,11 @@ function clearBulkLanesForm() {
         return;
     }
 
-    // Populate hidden form fields with empty lanes
-    document.getElementById('bulk-sample-ids').value = JSON.stringify(selectedSampleIds);
-    document.getElementById('bulk-lanes').value = JSON.stringify([]);
-
-    // Trigger HTMX form submission
-    htmx.trigger('#bulk-lanes-form', 'submit');
+    // Submit with empty lanes
+    submitBulkAction('set-lanes', {
+        sample_ids: JSON.stringify(selectedSampleIds),
+        lanes: JSON.stringify([]),
+    });
 }
 
 function toggleBulkLanes() {
@@ -325,13 +365,11 @@ function applyBulkMismatchesForm() {
     const mismatchI7 = document.getElementById('bulk-mismatch-i7-input').value;
     const mismatchI5 = document.getElementById('bulk-mismatch-i5-input').value;
 
-    // Populate hidden form fields
-    document.getElementById('bulk-mismatch-sample-ids').value = JSON.stringify(selectedSampleIds);
-    document.getElementById('bulk-mismatch-index1').value = mismatchI7;
-    document.getElementById('bulk-mismatch-index2').value = mismatchI5;
-
-    // Trigger HTMX form submission
-    htmx.trigger('#bulk-mismatches-form', 'submit');
+    submitBulkAction('set-mismatches', {
+        sample_ids: JSON.stringify(selectedSampleIds),
+        mismatch_index1: mismatchI7,
+        mismatch_index2: mismatchI5,
+    });
 }
 
 function clearBulkMismatchesForm() {
@@ -341,13 +379,12 @@ function clearBulkMismatchesForm() {
         return;
     }
 
-    // Populate hidden form fields with empty values to clear
-    document.getElementById('bulk-mismatch-sample-ids').value = JSON.stringify(selectedSampleIds);
-    document.getElementById('bulk-mismatch-index1').value = '';
-    document.getElementById('bulk-mismatch-index2').value = '';
-
-    // Trigger HTMX form submission
-    htmx.trigger('#bulk-mismatches-form', 'submit');
+    // Submit empty values to clear
+    submitBulkAction('set-mismatches', {
+        sample_ids: JSON.stringify(selectedSampleIds),
+        mismatch_index1: '',
+        mismatch_index2: '',
+    });
 }
 
 function applyBulkOverrideCyclesForm() {
@@ -359,12 +396,10 @@ function applyBulkOverrideCyclesForm() {
 
     const overrideCycles = document.getElementById('bulk-override-cycles-input').value;
 
-    // Populate hidden form fields
-    document.getElementById('bulk-override-sample-ids').value = JSON.stringify(selectedSampleIds);
-    document.getElementById('bulk-override-cycles').value = overrideCycles;
-
-    // Trigger HTMX form submission
-    htmx.trigger('#bulk-override-form', 'submit');
+    submitBulkAction('set-override-cycles', {
+        sample_ids: JSON.stringify(selectedSampleIds),
+        override_cycles: overrideCycles,
+    });
 }
 
 function clearBulkOverrideCyclesForm() {
@@ -374,12 +409,11 @@ function clearBulkOverrideCyclesForm() {
         return;
     }
 
-    // Populate hidden form fields with empty value to recalculate auto
-    document.getElementById('bulk-override-sample-ids').value = JSON.stringify(selectedSampleIds);
-    document.getElementById('bulk-override-cycles').value = '';
-
-    // Trigger HTMX form submission
-    htmx.trigger('#bulk-override-form', 'submit');
+    // Submit an empty value to recalculate auto
+    submitBulkAction('set-override-cycles', {
+        sample_ids: JSON.stringify(selectedSampleIds),
+        override_cycles: '',
+    });
 }
 
 function applyBulkTestIdForm() {
@@ -391,12 +425,10 @@ function applyBulkTestIdForm() {
 
     const testId = document.getElementById('bulk-test-id-input').value;
 
-    // Populate hidden form fields
-    document.getElementById('bulk-test-id-sample-ids').value = JSON.stringify(selectedSampleIds);
-    document.getElementById('bulk-test-id').value = testId;
-
-    // Trigger HTMX form submission
-    htmx.trigger('#bulk-test-id-form', 'submit');
+    submitBulkAction('set-test-id', {
+        sample_ids: JSON.stringify(selectedSampleIds),
+        test_id: testId,
+    });
 }
 
 function clearBulkTestIdForm() {
@@ -406,12 +438,11 @@ function clearBulkTestIdForm() {
         return;
     }
 
-    // Populate hidden form fields with empty value to clear
-    document.getElementById('bulk-test-id-sample-ids').value = JSON.stringify(selectedSampleIds);
-    document.getElementById('bulk-test-id').value = '';
-
-    // Trigger HTMX form submission
-    htmx.trigger('#bulk-test-id-form', 'submit');
+    // Submit an empty value to clear
+    submitBulkAction('set-test-id', {
+        sample_ids: JSON.stringify(selectedSampleIds),
+        test_id: '',
+    });
 }
 
 function applyBulkDeleteForm() {
@@ -421,11 +452,13 @@ function applyBulkDeleteForm() {
         return;
     }
 
-    // Populate hidden form field
-    document.getElementById('bulk-delete-sample-ids').value = JSON.stringify(selectedSampleIds);
+    if (!confirm('Delete selected samples?')) {
+        return;
+    }
 
-    // Trigger HTMX form submission (will show confirm dialog from hx-confirm)
-    htmx.trigger('#bulk-delete-form', 'submit');
+    submitBulkAction('bulk-delete', {
+        sample_ids: JSON.stringify(selectedSampleIds),
+    });
 }
 
 // =========================================================================
@@ -1,6 +1,26 @@
 """HTML and JavaScript escaping utilities."""
 
-import html as html_module
+from collections.abc import Iterable
+
+# Translation tables for the escape helpers below
+_JS_STRING_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    "'": "\\'",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "<": "\\x3c",  # Prevent breaking out of script context
+    ">": "\\x3e",
+})
+
+# Same mapping as html.escape(value, quote=True)
+_HTML_ATTR_ESCAPES = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
 
 
 def escape_js_string(value: str) -> str:
@@ -15,18 +35,9 @@ def escape_js_string(value: str) -> str:
     Returns:
         Escaped string safe for JavaScript string literals
     """
-    if not value:
-        return ""
-    # Escape backslashes first, then single quotes (for JS strings)
-    # Also escape newlines and other control characters
-    value = value.replace("\\", "\\\\")
-    value = value.replace("'", "\\'")
-    value = value.replace('"', '\\"')
-    value = value.replace("\n", "\\n")
-    value = value.replace("\r", "\\r")
-    value = value.replace("<", "\\x3c")  # Prevent breaking out of script context
-    value = value.replace(">", "\\x3e")
-    return value
+    # Single translate pass: each character is mapped once, so backslashes
+    # introduced by a replacement are never escaped again
+    return value.translate(_JS_STRING_ESCAPES) if value else ""
 
 
 def escape_html_attr(value: str) -> str:
@@ -39,4 +50,21 @@ def escape_html_attr(value: str) -> str:
     Returns:
         Escaped string safe for HTML attributes
     """
-    return html_module.escape(value, quote=True) if value else ""
+    return value.translate(_HTML_ATTR_ESCAPES) if value else ""
+
+
+def options_html(options: Iterable[tuple[str, str, bool]]) -> str:
+    """
+    Render <option> elements as a single HTML string.
+
+    Args:
+        options: (value, label, selected) tuples; values and labels are escaped
+
+    Returns:
+        Concatenated <option> markup, for use as a NotStr child of a Select
+    """
+    return "".join([
+        f'<option value="{escape_html_attr(value)}"{" selected" if selected else ""}>'
+        f"{escape_html_attr(label)}</option>"
+        for value, label, selected in options
+    ])
@@ -2,7 +2,7 @@
 
 import pytest
 
-from seqsetup.utils.html import escape_html_attr, escape_js_string
+from seqsetup.utils.html import escape_html_attr, escape_js_string, options_html
 
 
 # ---------------------------------------------------------------------------
@@ -89,3 +89,23 @@ class TestEscapeHtmlAttr:
         payload = '" onmouseover="alert(1)" foo="'
         result = escape_html_attr(payload)
         assert '"' not in result  # all quotes should be entity-encoded
+
+
+# ---------------------------------------------------------------------------
+# options_html
+# ---------------------------------------------------------------------------
+
+
+class TestOptionsHtml:
+    """Tests for options_html()."""
+
+    def test_empty(self):
+        assert options_html([]) == ""
+
+    def test_selected_marked(self):
+        result = options_html([("a", "A", False), ("b", "B", True)])
+        assert result == '<option value="a">A</option><option value="b" selected>B</option>'
+
+    def test_value_and_label_escaped(self):
+        result = options_html([('"x"', "<b>", False)])
+        assert result == '<option value="&quot;x&quot;">&lt;b&gt;</option>'
@@ -4,7 +4,9 @@ import pytest
 
 from seqsetup.models.sequencing_run import RunStatus, SequencingRun
 from seqsetup.routes.utils import (
+    check_not_modified,
     check_run_editable,
+    compute_etag,
     get_username,
     require_admin,
     sanitize_filename,
@@ -374,4 +376,66 @@ class TestSanitizeString:
         s = "  test  "
         once = sanitize_string(s, max_len=256)
         twice = sanitize_string(once, max_len=256)
-        assert once == twice
\ No newline at end of file
+        assert once == twice
+
+
+# ---------------------------------------------------------------------------
+# compute_etag / check_not_modified
+# ---------------------------------------------------------------------------
+
+
+class _FakeHeaderRequest:
+    """Minimal request stub with a headers dict."""
+
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+
+
+class TestComputeEtag:
+    """Tests for compute_etag."""
+
+    def test_returns_weak_etag(self):
+        etag = compute_etag("a", 1)
+        assert etag.startswith('W/"') and etag.endswith('"')
+
+    def test_same_parts_same_etag(self):
+        assert compute_etag("a", [1, 2]) == compute_etag("a", [1, 2])
+
+    def test_different_parts_different_etag(self):
+        assert compute_etag("a", [1, 2]) != compute_etag("a", [1, 3])
+
+    def test_part_order_matters(self):
+        assert compute_etag("a", "b") != compute_etag("b", "a")
+
+
+class TestCheckNotModified:
+    """Tests for check_not_modified."""
+
+    def test_no_header_returns_none(self):
+        assert check_not_modified(_FakeHeaderRequest(), compute_etag("x")) is None
+
+    def test_matching_etag_returns_304(self):
+        etag = compute_etag("x")
+        req = _FakeHeaderRequest({"if-none-match": etag})
+        result = check_not_modified(req, etag)
+        assert result is not None
+        assert result.status_code == 304
+        assert result.headers["etag"] == etag
+
+    def test_strong_form_of_weak_etag_matches(self):
+        etag = compute_etag("x")
+        req = _FakeHeaderRequest({"if-none-match": etag.removeprefix("W/")})
+        assert check_not_modified(req, etag).status_code == 304
+
+    def test_match_in_list(self):
+        etag = compute_etag("x")
+        req = _FakeHeaderRequest({"if-none-match": f'W/"other", {etag}'})
+        assert check_not_modified(req, etag).status_code == 304
+
+    def test_wildcard_matches(self):
+        req = _FakeHeaderRequest({"if-none-match": "*"})
+        assert check_not_modified(req, compute_etag("x")).status_code == 304
+
+    def test_stale_etag_returns_none(self):
+        req = _FakeHeaderRequest({"if-none-match": compute_etag("old")})
+        assert check_not_modified(req, compute_etag("new")) is None
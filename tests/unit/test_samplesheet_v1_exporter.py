@@ -57,6 +57,9 @@ class TestSampleSheetV1ExporterSupports:
     def test_not_supports_nextseq(self):
         assert SampleSheetV1Exporter.supports(InstrumentPlatform.NEXTSEQ_500_550) is False
 
+    def test_supported_platforms_is_immutable(self):
+        assert isinstance(SampleSheetV1Exporter.SUPPORTED_PLATFORMS, frozenset)
+
 
 @pytest.fixture
 def miseq_run():
@@ -626,6 +626,40 @@ class TestValidateRun:
         result = ValidationService.validate_run(run)
         assert hasattr(result, "color_balance")
 
+    def test_sections_skip_display_data(self):
+        """Skipped sections are None but error counts are unchanged."""
+        run = SequencingRun(
+            instrument_platform=InstrumentPlatform.NOVASEQ_X,
+            flowcell_type="10B",
+            samples=[
+                Sample(sample_id="S1"),
+                Sample(sample_id="S1"),  # Duplicate
+            ],
+        )
+
+        full = ValidationService.validate_run(run)
+        partial = ValidationService.validate_run(run, sections=())
+        assert partial.distance_matrices is None
+        assert partial.color_balance is None
+        assert partial.dark_cycle_samples is None
+        assert partial.color_balance_issue_count is None
+        assert partial.error_count == full.error_count
+        assert partial.warning_count == full.warning_count
+
+    def test_sections_compute_requested_only(self):
+        """Only requested sections are computed."""
+        from seqsetup.services.validation import SECTION_MATRICES
+
+        run = SequencingRun(
+            instrument_platform=InstrumentPlatform.NOVASEQ_X,
+            flowcell_type="10B",
+            samples=[Sample(sample_id="S1")],
+        )
+
+        result = ValidationService.validate_run(run, sections={SECTION_MATRICES})
+        assert result.distance_matrices == {}
+        assert result.color_balance is None
+
 
 class TestColorBalance:
     """Tests for color balance calculation."""
@@ -876,6 +910,46 @@ class TestColorBalance:
             assert pos.a_count == 2
             assert pos.t_count == 0
 
+
+class TestDarkCycles:
+    """Tests for dark cycle detection."""
+
+    def _make_sample(self, sample_id: str, i7_seq: str) -> Sample:
+        return Sample(
+            sample_id=sample_id,
+            index1=Index(name=f"i7_{sample_id}", sequence=i7_seq, index_type=IndexType.I7),
+        )
+
+    def test_leading_dark_counts(self):
+        """Leading dark bases are counted over the first two positions only."""
+        run = SequencingRun(
+            instrument_platform=InstrumentPlatform.NOVASEQ_X,
+            flowcell_type="10B",
+            samples=[
+                self._make_sample("S1", "GGGA"),
+                self._make_sample("S2", "gATC"),
+                self._make_sample("S3", "AGGT"),
+            ],
+        )
+
+        info = ValidationService.build_dark_cycle_info(run, {"dark_base": "G"})
+        assert [s.i7_leading_dark for s in info] == [2, 1, 0]
+
+    def test_two_leading_dark_is_error(self):
+        """Only indexes starting with two dark bases are errors."""
+        run = SequencingRun(
+            instrument_platform=InstrumentPlatform.NOVASEQ_X,
+            flowcell_type="10B",
+            samples=[
+                self._make_sample("S1", "ggAT"),
+                self._make_sample("S2", "GATC"),
+            ],
+        )
+
+        errors = ValidationService.validate_dark_cycles(run, {"dark_base": "G"})
+        assert [e.sample_name for e in errors] == ["S1"]
+
+
 class TestValidationServiceEdgeCases:
     """Edge case tests for ValidationService."""
 